@@ -138,3 +138,16 @@ else:
     pg = st.navigation([st.Page(login_page, title="Log in", default=True)])
 
 pg.run()
+
+# ============ AIRTABLE THROTTLING ============
+if st.session_state.get("authenticated"):
+    from helpers import get_airtable_stats
+
+    stats = get_airtable_stats()
+    if stats["throttled_requests"] or stats["retries"]:
+        with st.sidebar:
+            st.caption(
+                f"Airtable rate limit: {stats['queue_depth']} queued • "
+                f"{stats['throttled_requests']} throttled • {stats['retries']} retried • "
+                f"max wait {stats['max_wait']:.1f}s"
+            )
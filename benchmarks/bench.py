@@ -0,0 +1,346 @@
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from datetime import date, datetime
+from pathlib import Path
+
+from benchmarks.synthetic import generate_alumni, generate_fellows, generate_status_reports
+
+# helpers reads st.secrets at import time, so run from a checkout with a
+# .streamlit/secrets.toml (the fake Airtable snippet is enough; nothing here
+# talks to the network).
+import helpers
+import roster
+from compliance import roster_compliance
+from records import Alumni, Fellow, StatusReport, enrich
+from search_index import ALUMNI_SEARCH_FIELDS, SearchIndex, TrigramIndex
+
+# ============ CONFIG ============
+DEFAULT_SIZES = (50, 1000, 10000)
+DEFAULT_THRESHOLD = 0.25  # flag cases more than 25% slower than the baseline
+BASELINE_DIR = Path(__file__).parent / "baselines"
+MIN_RUN_TIME = 0.2  # seconds per repeat, used to pick the loop count
+REPEATS = 5
+
+FELLOW_QUERIES = [
+    # (search, filters, sort) — a typical mix of what staff click through
+    ("", {}, roster.FELLOW_DEFAULT_SORT),
+    ("", {}, "Priority (Flagged first)"),
+    ("ch", {"status": "Active"}, "Name (A-Z)"),
+    ("sen", {"chamber": "Senate", "party": "Democrat"}, "Last Check-in (oldest first)"),
+    ("", {"fellow_type": "Congressional Innovation Fellow"}, "End Date (soonest first)")
+]
+ALUMNI_QUERIES = [
+    ("", {}, roster.ALUMNI_DEFAULT_SORT),
+    ("policy", {}, "Name (A-Z)"),
+    ("goo", {"sector": "Private"}, "Organization (A-Z)"),
+    ("", {"fellow_type": "AI Security Fellow", "chamber": "Senate"}, "Last Engaged (newest first)"),
+    ("an", {"party": "Republican"}, "Sector")
+]
+
+
+# ============ DATA ============
+
+class Dataset:
+    """Synthetic raw records plus decoded rows for one roster size"""
+
+    def __init__(self, size, seed=0):
+        rng = random.Random(seed)
+        today = date.today()
+        self.size = size
+        self.fellow_records = generate_fellows(rng, size, today)
+        self.alumni_records = generate_alumni(rng, size, today)
+        self.fellows = enrich([Fellow.from_record(r) for r in self.fellow_records])
+        self.alumni = enrich([Alumni.from_record(r) for r in self.alumni_records])
+
+        reports = [StatusReport.from_record(r)
+                   for r in generate_status_reports(rng, self.fellow_records, today)]
+        self.all_reports = reports
+        by_fellow = {}
+        for report in reports:
+            for fellow_id in report["fellow"]:
+                by_fellow.setdefault(fellow_id, []).append(report)
+        self.reports = by_fellow
+        self.required = {f["id"]: helpers.get_required_report_months(f) for f in self.fellows}
+
+
+# ============ CASES ============
+# Each case takes a Dataset and returns a zero-argument callable to time.
+
+def case_required_months(data):
+    fellows = data.fellows
+    return lambda: [helpers.get_required_report_months(f) for f in fellows]
+
+
+def case_report_streak(data):
+    pairs = [(data.reports.get(f["id"], []), data.required[f["id"]]) for f in data.fellows]
+    return lambda: [helpers.calculate_report_streak(reports, months) for reports, months in pairs]
+
+
+def case_roster_compliance(data):
+    fellows, reports = data.fellows, data.all_reports
+    return lambda: roster_compliance(fellows, reports)
+
+
+def case_days_since(data):
+    dates = [f["last_check_in"] for f in data.fellows]
+    return lambda: [helpers.calculate_days_since(d) for d in dates]
+
+
+def case_days_until(data):
+    dates = [f["end_date"] for f in data.fellows]
+    return lambda: [helpers.calculate_days_until(d) for d in dates]
+
+
+def case_decode_fellows(data):
+    records = data.fellow_records
+    return lambda: [Fellow.from_record(r) for r in records]
+
+
+def case_decode_alumni(data):
+    records = data.alumni_records
+    return lambda: [Alumni.from_record(r) for r in records]
+
+
+def case_enrich_fellows(data):
+    fellows = data.fellows
+
+    def run():
+        for fellow in fellows:
+            fellow.derived_on = 0  # force the daily recompute
+        enrich(fellows)
+    return run
+
+
+def case_fellows_page(data):
+    fellows = roster.FellowRoster(data.fellows)
+
+    def run():
+        for search, filters, sort_by in FELLOW_QUERIES:
+            fellows.stats()
+            fellows.cohorts()
+            fellows.facet_counts(search=search, **filters)
+            fellows.query(sort_by, search=search, **filters)
+    return run
+
+
+def case_alumni_page(data):
+    alumni = roster.AlumniRoster(data.alumni)
+
+    def run():
+        for search, filters, sort_by in ALUMNI_QUERIES:
+            alumni.stats()
+            alumni.cohorts()
+            alumni.facet_counts(search=search, **filters)
+            alumni.query(sort_by, search=search, **filters)
+    return run
+
+
+def case_search_index_build(data):
+    alumni = data.alumni
+    return lambda: SearchIndex(alumni, ALUMNI_SEARCH_FIELDS)
+
+
+def case_search_keystrokes(data):
+    """Typing "policy advisor" one character at a time, starting from a cold term cache"""
+    index = SearchIndex(data.alumni, ALUMNI_SEARCH_FIELDS)
+    query = "policy advisor"
+
+    def run():
+        index._terms.clear()
+        for end in range(1, len(query) + 1):
+            index.search(query[:end])
+    return run
+
+
+def case_fellows_columns_build(data):
+    fellows = data.fellows
+    return lambda: roster.FellowColumns(fellows)
+
+
+def case_fellows_columns(data):
+    columns = roster.FellowColumns(data.fellows)
+
+    def run():
+        for search, filters, sort_by in FELLOW_QUERIES:
+            columns.stats()
+            columns.cohorts()
+            columns.facet_counts(search=search, **filters)
+            columns.query(sort_by, search=search, **filters)
+    return run
+
+
+def case_alumni_columns_build(data):
+    alumni = data.alumni
+    return lambda: roster.AlumniColumns(alumni)
+
+
+def case_alumni_columns(data):
+    columns = roster.AlumniColumns(data.alumni)
+
+    def run():
+        for search, filters, sort_by in ALUMNI_QUERIES:
+            columns.stats()
+            columns.cohorts()
+            columns.facet_counts(search=search, **filters)
+            columns.query(sort_by, search=search, **filters)
+    return run
+
+
+def case_fuzzy_search(data):
+    """Misspelled lookups against a prebuilt trigram index, from a cold term cache"""
+    fuzzy = TrigramIndex(SearchIndex(data.alumni, ALUMNI_SEARCH_FIELDS))
+    queries = ["polcy advisor", "goggle", "stanfrod", "jordn"]
+
+    def run():
+        fuzzy._terms.clear()
+        for query in queries:
+            fuzzy.top(query)
+    return run
+
+
+CASES = {
+    "get_required_report_months": case_required_months,
+    "calculate_report_streak": case_report_streak,
+    "roster_compliance": case_roster_compliance,
+    "calculate_days_since": case_days_since,
+    "calculate_days_until": case_days_until,
+    "decode_fellows": case_decode_fellows,
+    "decode_alumni": case_decode_alumni,
+    "enrich_fellows": case_enrich_fellows,
+    "fellows_page_pipeline": case_fellows_page,
+    "alumni_page_pipeline": case_alumni_page,
+    "search_index_build": case_search_index_build,
+    "search_keystrokes": case_search_keystrokes,
+    "fuzzy_search": case_fuzzy_search,
+    "fellows_columns_build": case_fellows_columns_build,
+    "fellows_columns_pipeline": case_fellows_columns,
+    "alumni_columns_build": case_alumni_columns_build,
+    "alumni_columns_pipeline": case_alumni_columns
+}
+
+
+# ============ TIMING ============
+
+def time_callable(func):
+    """Best and median seconds per call over REPEATS runs of an auto-sized loop"""
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - started
+        if elapsed >= MIN_RUN_TIME or loops >= 1 << 20:
+            break
+        loops *= 2
+
+    samples = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        samples.append((time.perf_counter() - started) / loops)
+    return {"best": min(samples), "median": statistics.median(samples), "loops": loops}
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, only=None, seed=0):
+    results = {}
+    for size in sizes:
+        data = Dataset(size, seed)
+        for name, case in CASES.items():
+            if only and not any(pattern in name for pattern in only):
+                continue
+            key = f"{name}[{size}]"
+            results[key] = time_callable(case(data))
+            print(f"{key:<40} {format_seconds(results[key]['best']):>10}", flush=True)
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sizes": list(sizes),
+            "seed": seed
+        },
+        "results": results
+    }
+
+
+def format_seconds(seconds):
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds:.2f} s"
+
+
+# ============ BASELINES ============
+
+def baseline_path(name):
+    path = Path(name)
+    if path.suffix != ".json":
+        path = BASELINE_DIR / f"{name}.json"
+    return path
+
+
+def save_baseline(report, name):
+    path = baseline_path(name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+    return path
+
+
+def compare(report, baseline, threshold=DEFAULT_THRESHOLD):
+    """Print current vs baseline per case. Returns the list of regressed case keys."""
+    regressions = []
+    print(f"\n{'case':<40} {'baseline':>10} {'current':>10} {'change':>8}")
+    for key, current in report["results"].items():
+        previous = baseline["results"].get(key)
+        if previous is None:
+            print(f"{key:<40} {'-':>10} {format_seconds(current['best']):>10} {'new':>8}")
+            continue
+        change = current["best"] / previous["best"] - 1
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(key)
+        print(f"{key:<40} {format_seconds(previous['best']):>10} "
+              f"{format_seconds(current['best']):>10} {change:>+7.0%}{flag}")
+    return regressions
+
+
+# ============ CLI ============
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark dashboard helpers and page pipelines.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="comma-separated roster sizes (default: 50,1000,10000)")
+    parser.add_argument("--only", action="append", help="run only cases whose name contains this (repeatable)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", metavar="NAME", help="save results as benchmarks/baselines/NAME.json (or a .json path)")
+    parser.add_argument("--compare", metavar="NAME", help="compare against a saved baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="fractional slowdown counted as a regression (default: 0.25)")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    report = run_benchmarks(sizes, args.only, args.seed)
+
+    if args.save:
+        print(f"\nSaved baseline to {save_baseline(report, args.save)}")
+
+    if args.compare:
+        baseline = json.loads(baseline_path(args.compare).read_text())
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) regressed by more than {args.threshold:.0%}")
+            return 1
+        print("\nNo regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,345 @@
+import argparse
+import json
+import random
+import re
+import string
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from benchmarks.synthetic import generate_base
+
+MAX_BATCH_RECORDS = 10  # Airtable's limit per create/update/delete request
+
+# ============ FORMULAS ============
+# Only the filterByFormula shapes helpers.py and mirror.py send are understood;
+# anything else is rejected with 422 like an invalid formula on Airtable.
+STRING = r'"((?:[^"\\]|\\.)*)"'
+LINKED_NAME_FORMULA = re.compile(
+    r'^FIND\(' + STRING + r', "\|" & ARRAYJOIN\(\{([^}]+)\}, "\|"\) & "\|"\)$'
+)
+MODIFIED_SINCE_FORMULA = re.compile(
+    r'^IS_AFTER\(LAST_MODIFIED_TIME\(\), DATETIME_PARSE\(' + STRING + r'\)\)$'
+)
+
+
+def unescape(literal):
+    return re.sub(r'\\(.)', r'\1', literal)
+
+
+def now_iso():
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+def new_record_id():
+    return "rec" + "".join(random.choices(string.ascii_letters + string.digits, k=14))
+
+
+# ============ FAKE BASE ============
+
+class FakeAirtable:
+    """In-memory stand-in for the parts of the Airtable REST API the dashboard uses.
+
+    Supports list (offset, pageSize, sort, fields[], filterByFormula), get,
+    create, patch and delete, single and batched. `latency` adds a delay to
+    every request, `error_rate` answers a random fraction of requests with
+    429, and `rate_limit` enforces a real requests-per-second limit.
+    """
+
+    def __init__(self, tables=None, latency=0.0, error_rate=0.0, rate_limit=None,
+                 page_size=100, linked_tables=None, seed=None):
+        self.tables = {}
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.page_size = page_size
+        # Linked-record field -> table it links to (resolved by primary "Name")
+        self.linked_tables = linked_tables or {"Fellow": "Fellows"}
+        self.stats = {"requests": 0, "throttled": 0}
+        self._recent = deque()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        for name, records in (tables or {}).items():
+            self.load(name, records)
+
+    def load(self, table, records):
+        """Seed a table with [{"id", "fields"}, ...] records"""
+        stamp = now_iso()
+        self.tables[table] = OrderedDict(
+            (r["id"], {"id": r["id"], "createdTime": stamp, "fields": dict(r["fields"]), "_modified": stamp})
+            for r in records
+        )
+
+    # ---------- request gate ----------
+
+    def admit(self):
+        """Apply latency, injected 429s and the rate limit. Returns False to answer 429."""
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.stats["requests"] += 1
+            if self.error_rate and self._random.random() < self.error_rate:
+                self.stats["throttled"] += 1
+                return False
+            if self.rate_limit:
+                now = time.monotonic()
+                while self._recent and now - self._recent[0] >= 1:
+                    self._recent.popleft()
+                if len(self._recent) >= self.rate_limit:
+                    self.stats["throttled"] += 1
+                    return False
+                self._recent.append(now)
+        return True
+
+    # ---------- queries ----------
+
+    def formula_filter(self, formula):
+        match = LINKED_NAME_FORMULA.match(formula)
+        if match:
+            needle, field = unescape(match.group(1)), match.group(2)
+            linked = self.tables.get(self.linked_tables.get(field), {})
+
+            def linked_names(record):
+                ids = record["fields"].get(field) or []
+                names = [linked[i]["fields"].get("Name", "") if i in linked else i for i in ids]
+                return "|" + "|".join(names) + "|"
+            return lambda record: needle in linked_names(record)
+
+        match = MODIFIED_SINCE_FORMULA.match(formula)
+        if match:
+            since = unescape(match.group(1))
+            return lambda record: record["_modified"] > since
+
+        return None
+
+    def list(self, table, query):
+        records = list(self.tables[table].values())
+
+        formula = query.get("filterByFormula", [""])[0]
+        if formula:
+            predicate = self.formula_filter(formula)
+            if predicate is None:
+                return 422, {"error": {"type": "INVALID_FILTER_BY_FORMULA", "message": f"Unsupported formula: {formula}"}}
+            records = [r for r in records if predicate(r)]
+
+        sorts = []
+        i = 0
+        while f"sort[{i}][field]" in query:
+            sorts.append((query[f"sort[{i}][field]"][0], query.get(f"sort[{i}][direction]", ["asc"])[0]))
+            i += 1
+        for field, direction in reversed(sorts):
+            records.sort(key=lambda r: (r["fields"].get(field) is None, str(r["fields"].get(field) or "")),
+                         reverse=direction == "desc")
+
+        page_size = min(int(query.get("pageSize", [self.page_size])[0]), self.page_size)
+        start = int(query.get("offset", ["0"])[0])
+        page = records[start:start + page_size]
+
+        body = {"records": [self.render(r, query.get("fields[]")) for r in page]}
+        if start + page_size < len(records):
+            body["offset"] = str(start + page_size)
+        return 200, body
+
+    def render(self, record, fields=None):
+        values = record["fields"]
+        if fields:
+            values = {k: v for k, v in values.items() if k in fields}
+        return {"id": record["id"], "createdTime": record["createdTime"], "fields": values}
+
+    # ---------- writes ----------
+
+    def create(self, table, fields):
+        record = {"id": new_record_id(), "createdTime": now_iso(), "fields": dict(fields), "_modified": now_iso()}
+        self.tables[table][record["id"]] = record
+        return self.render(record)
+
+    def update(self, table, record_id, fields):
+        record = self.tables[table].get(record_id)
+        if record is None:
+            return None
+        record["fields"].update(fields)
+        record["_modified"] = now_iso()
+        return self.render(record)
+
+    def delete(self, table, record_id):
+        return self.tables[table].pop(record_id, None) is not None
+
+
+# ============ HTTP HANDLER ============
+
+def make_handler(base):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+
+        def log_message(self, *args):
+            pass
+
+        def send_json(self, status, body):
+            payload = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def route(self):
+            """Return (table, record_id, query) or None after answering an error"""
+            # Consume the body before any early answer, or on a keep-alive
+            # connection it would be read as the next request line
+            length = int(self.headers.get("Content-Length") or 0)
+            self.raw_body = self.rfile.read(length)
+            parts = urlsplit(self.path)
+            segments = [unquote(p) for p in parts.path.strip("/").split("/")]
+            if segments == ["__stats"]:
+                self.send_json(200, base.stats)
+                return None
+            if len(segments) not in (3, 4) or segments[0] != "v0":
+                self.send_json(404, {"error": "NOT_FOUND"})
+                return None
+            if not base.admit():
+                self.send_json(429, {"errors": [{"error": "RATE_LIMIT_REACHED"}]})
+                return None
+            table = segments[2]
+            if table not in base.tables:
+                self.send_json(404, {"error": {"type": "TABLE_NOT_FOUND"}})
+                return None
+            record_id = segments[3] if len(segments) == 4 else None
+            return table, record_id, parse_qs(parts.query, keep_blank_values=True)
+
+        def read_body(self):
+            return json.loads(self.raw_body or b"{}")
+
+        def too_many_records(self, records):
+            """Answer 422 for a batch over the API's limit of 10 records"""
+            if len(records) <= MAX_BATCH_RECORDS:
+                return False
+            self.send_json(422, {"error": {
+                "type": "INVALID_RECORDS", "message": f"At most {MAX_BATCH_RECORDS} records per request"
+            }})
+            return True
+
+        def do_GET(self):
+            routed = self.route()
+            if routed is None:
+                return
+            table, record_id, query = routed
+            with base._lock:
+                if record_id:
+                    record = base.tables[table].get(record_id)
+                    status, body = (200, base.render(record)) if record else (404, {"error": "NOT_FOUND"})
+                else:
+                    status, body = base.list(table, query)
+            self.send_json(status, body)
+
+        def do_POST(self):
+            routed = self.route()
+            if routed is None:
+                return
+            table, _, _ = routed
+            body = self.read_body()
+            if self.too_many_records(body.get("records", [])):
+                return
+            with base._lock:
+                if "records" in body:
+                    created = [base.create(table, r.get("fields", {})) for r in body["records"]]
+                    self.send_json(200, {"records": created})
+                else:
+                    self.send_json(200, base.create(table, body.get("fields", {})))
+
+        def do_PATCH(self):
+            routed = self.route()
+            if routed is None:
+                return
+            table, record_id, _ = routed
+            body = self.read_body()
+            if self.too_many_records(body.get("records", [])):
+                return
+            with base._lock:
+                if record_id:
+                    updated = base.update(table, record_id, body.get("fields", {}))
+                    if updated:
+                        self.send_json(200, updated)
+                    else:
+                        self.send_json(404, {"error": "NOT_FOUND"})
+                else:
+                    updated = [base.update(table, r["id"], r.get("fields", {})) for r in body.get("records", [])]
+                    if None in updated:
+                        self.send_json(422, {"error": {"type": "ROW_DOES_NOT_EXIST"}})
+                    else:
+                        self.send_json(200, {"records": updated})
+
+        def do_DELETE(self):
+            routed = self.route()
+            if routed is None:
+                return
+            table, record_id, query = routed
+            if self.too_many_records(query.get("records[]", [])):
+                return
+            with base._lock:
+                if record_id:
+                    if base.delete(table, record_id):
+                        self.send_json(200, {"id": record_id, "deleted": True})
+                    else:
+                        self.send_json(404, {"error": "NOT_FOUND"})
+                else:
+                    ids = query.get("records[]", [])
+                    self.send_json(200, {"records": [{"id": i, "deleted": base.delete(table, i)} for i in ids]})
+
+    return Handler
+
+
+def serve(base, host="127.0.0.1", port=8765):
+    """Create (but don't start) an HTTP server for a FakeAirtable base"""
+    return ThreadingHTTPServer((host, port), make_handler(base))
+
+
+def start_in_thread(base, host="127.0.0.1", port=0):
+    """Serve a base on a background thread. Returns (server, api_url)."""
+    server = serve(base, host, port)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}/v0"
+
+
+# ============ CLI ============
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local fake Airtable API seeded with synthetic data.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fellows", type=int, default=500)
+    parser.add_argument("--alumni", type=int, default=10000)
+    parser.add_argument("--checkins-per-fellow", type=int, default=10)
+    parser.add_argument("--fellows-table", default="Fellows")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 429")
+    parser.add_argument("--rate-limit", type=int, default=None, help="requests per second before 429")
+    parser.add_argument("--page-size", type=int, default=100)
+    args = parser.parse_args()
+
+    tables = generate_base(args.fellows, args.alumni, args.checkins_per_fellow, args.seed, args.fellows_table)
+    base = FakeAirtable(
+        tables, latency=args.latency, error_rate=args.error_rate, rate_limit=args.rate_limit,
+        page_size=args.page_size, linked_tables={"Fellow": args.fellows_table}
+    )
+    server = serve(base, args.host, args.port)
+
+    counts = ", ".join(f"{len(records)} {name}" for name, records in tables.items())
+    print(f"Fake Airtable serving {counts}")
+    print("Point the dashboard at it in .streamlit/secrets.toml:\n")
+    print("[airtable]")
+    print('api_key = "fake"')
+    print('base_id = "appFAKE"')
+    print(f'table_name = "{args.fellows_table}"')
+    print(f'api_url = "http://{args.host}:{args.port}/v0"')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
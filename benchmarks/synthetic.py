@@ -0,0 +1,164 @@
+import random
+import string
+from datetime import date, timedelta
+
+# ============ VOCABULARY ============
+FIRST_NAMES = [
+    "Alex", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Avery", "Quinn", "Jamie", "Drew",
+    "Priya", "Wei", "Fatima", "Diego", "Aisha", "Kenji", "Elena", "Samuel", "Nadia", "Omar"
+]
+LAST_NAMES = [
+    "Nguyen", "Garcia", "Smith", "Patel", "Kim", "Johnson", "Okafor", "Chen", "Rivera", "Cohen",
+    "Brown", "Singh", "Martinez", "Lee", "Williams", "Haddad", "Kowalski", "Moreau", "Ito", "Silva"
+]
+STATES = ["WA", "CA", "NY", "TX", "OH", "MI", "GA", "MN", "CO", "VA", "NJ", "AZ"]
+SENATORS = ["Cantwell", "Warner", "Young", "Hickenlooper", "Klobuchar", "Cornyn", "Peters", "Ossoff"]
+AGENCIES = ["Department of Commerce", "Department of Energy", "NIST", "CISA", "OSTP", "Department of State"]
+ORGS = ["Google", "Microsoft", "Mozilla", "Brookings", "CSET", "New America", "Stanford", "MIT",
+        "US Digital Service", "GAO", "Anthropic", "OpenAI", "EFF", "Code for America", "RAND"]
+ROLES = ["Policy Advisor", "Senior Engineer", "Research Fellow", "Director of Policy", "Counsel",
+         "Product Manager", "Professor", "Chief Technologist", "Staff Director", "Data Scientist"]
+CITIES = ["Washington, DC", "San Francisco, CA", "New York, NY", "Seattle, WA", "Boston, MA", "Austin, TX"]
+SCHOOLS = ["Stanford", "MIT", "Berkeley", "Carnegie Mellon", "Georgetown", "Michigan", "Howard"]
+DEGREES = ["BS Computer Science", "PhD Computer Science", "MS Data Science", "JD", "PhD Physics", "MPP"]
+
+FELLOW_TYPES = ["Congressional Innovation Fellow", "Senior Congressional Innovation Fellow", "AI Security Fellow"]
+ALUMNI_TYPES = FELLOW_TYPES + ["Congressional Innovation Scholar", "Congressional Digital Service Fellow"]
+PARTIES = ["Democrat", "Republican", "Independent"]
+STATUSES = ["Active", "Active", "Active", "Flagged", "Ending Soon"]
+SECTORS = ["Government", "Nonprofit", "Academia", "Private", "Policy/Think Tank"]
+CHECKIN_TYPES = ["Email", "Phone", "Zoom", "In-person", "Slack", "Text"]
+STAFF = ["Sam", "Lee", "Dana", "Chris"]
+
+
+def record_id(rng):
+    """An Airtable-style record ID"""
+    return "rec" + "".join(rng.choices(string.ascii_letters + string.digits, k=14))
+
+
+def long_text(rng, sentences):
+    words = ["fellow", "office", "policy", "hearing", "briefing", "AI", "privacy", "staff", "bill",
+             "markup", "oversight", "cyber", "placement", "network", "introduced", "committee"]
+    return " ".join(
+        " ".join(rng.choices(words, k=rng.randint(8, 16))).capitalize() + "."
+        for _ in range(sentences)
+    )
+
+
+def month_label(d):
+    return d.strftime("%b %Y")
+
+
+# ============ GENERATORS ============
+
+def generate_fellows(rng, count, today):
+    fellows = []
+    for _ in range(count):
+        fellow_type = rng.choice(FELLOW_TYPES)
+        is_aisf = fellow_type == "AI Security Fellow"
+        cohort = rng.choice([today.year - 1, today.year])
+        start = date(cohort, 1, 15)
+        chamber = "Executive Branch" if is_aisf else rng.choice(["Senate", "House"])
+        office = rng.choice(AGENCIES) if is_aisf else f"Sen. {rng.choice(SENATORS)} ({rng.choice('DR')}-{rng.choice(STATES)})"
+        fields = {
+            "Name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            "Email": f"fellow{rng.randint(1000, 99999)}@example.org",
+            "Phone Number": f"202-555-{rng.randint(1000, 9999)}",
+            "Fellow Type": fellow_type,
+            "Office": office,
+            "Chamber": chamber,
+            "LinkedIn": "https://www.linkedin.com/in/example",
+            "Start Date": start.isoformat(),
+            "End Date": (start + timedelta(days=rng.choice([365, 600]))).isoformat(),
+            "Cohort": str(cohort),
+            "Status": rng.choice(STATUSES),
+            "Last Check-in": (today - timedelta(days=rng.randint(0, 300))).isoformat(),
+            "Prior Role": f"{rng.choice(ROLES)} at {rng.choice(ORGS)}",
+            "Education": f"{rng.choice(DEGREES)}, {rng.choice(SCHOOLS)}",
+            "Notes": long_text(rng, rng.randint(2, 12)),
+            "Requires Monthly Reports": rng.random() < 0.7,
+            "Report Start Date": date(today.year, rng.choice([2, 3]), 1).isoformat()
+        }
+        if not is_aisf:
+            fields["Party"] = rng.choice(PARTIES)
+        fellows.append({"id": record_id(rng), "fields": fields})
+    return fellows
+
+
+def generate_alumni(rng, count, today):
+    alumni = []
+    for _ in range(count):
+        types = rng.sample(ALUMNI_TYPES, k=rng.choice([1, 1, 1, 2]))
+        fields = {
+            "Name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            "Email": f"alum{rng.randint(1000, 999999)}@example.org",
+            "Phone Number": f"202-555-{rng.randint(1000, 9999)}",
+            "Cohort": str(rng.randint(2015, today.year - 1)),
+            "Fellow Type": types,
+            "Office Served": f"Sen. {rng.choice(SENATORS)} ({rng.choice('DR')}-{rng.choice(STATES)})",
+            "Chamber": rng.choice(["Senate", "House", "Executive Branch"]),
+            "Party": rng.choice(PARTIES),
+            "Current Role": rng.choice(ROLES),
+            "Current Organization": rng.choice(ORGS),
+            "Sector": rng.choice(SECTORS),
+            "Location": rng.choice(CITIES),
+            "LinkedIn": "https://www.linkedin.com/in/example",
+            "Last Engaged": (today - timedelta(days=rng.randint(0, 900))).isoformat(),
+            "Engagement Notes": long_text(rng, rng.randint(1, 10)),
+            "Notes": long_text(rng, rng.randint(1, 20)),
+            "Prior Role": f"{rng.choice(ROLES)} at {rng.choice(ORGS)}",
+            "Education": f"{rng.choice(DEGREES)}, {rng.choice(SCHOOLS)}"
+        }
+        alumni.append({"id": record_id(rng), "fields": fields})
+    return alumni
+
+
+def generate_checkins(rng, fellows, per_fellow, today):
+    checkins = []
+    for fellow in fellows:
+        for _ in range(rng.randint(0, per_fellow * 2)):
+            checkins.append({"id": record_id(rng), "fields": {
+                "Fellow": [fellow["id"]],
+                "Date": (today - timedelta(days=rng.randint(0, 700))).isoformat(),
+                "Check-in Type": rng.choice(CHECKIN_TYPES),
+                "Notes": long_text(rng, rng.randint(1, 4)),
+                "Staff Member": rng.choice(STAFF)
+            }})
+    return checkins
+
+
+def generate_status_reports(rng, fellows, today):
+    reports = []
+    for fellow in fellows:
+        fields = fellow["fields"]
+        if not fields.get("Requires Monthly Reports"):
+            continue
+        month = date.fromisoformat(fields["Report Start Date"])
+        while month <= today:
+            if rng.random() < 0.8:
+                reports.append({"id": record_id(rng), "fields": {
+                    "Fellow": [fellow["id"]],
+                    "Month": month_label(month),
+                    "Submitted": True,
+                    "Date Submitted": (month + timedelta(days=rng.randint(10, 40))).isoformat()
+                }})
+            month = date(month.year + (month.month == 12), month.month % 12 + 1, 1)
+    return reports
+
+
+def generate_base(fellows=500, alumni=10000, checkins_per_fellow=10, seed=0,
+                  fellows_table="Fellows", today=None):
+    """Build a synthetic base as {table name: [{"id", "fields"}, ...]}.
+
+    Check-ins and status reports are linked to the generated fellows by
+    record ID, the same way the real Fellow linked-record field works.
+    """
+    rng = random.Random(seed)
+    today = today or date.today()
+    fellow_records = generate_fellows(rng, fellows, today)
+    return {
+        fellows_table: fellow_records,
+        "Alumni": generate_alumni(rng, alumni, today),
+        "Check-ins": generate_checkins(rng, fellow_records, checkins_per_fellow, today),
+        "Status Reports": generate_status_reports(rng, fellow_records, today)
+    }
@@ -0,0 +1,189 @@
+import threading
+from collections import OrderedDict
+from datetime import date
+from html import escape
+
+import streamlit as st
+from streamlit.components.v2 import component
+
+# ============ CARD GRID ============
+# Pages filter and sort the full roster, but only render the first few
+# pages of cards; "Load more" grows the grid one page at a time. The loaded
+# cards go to the browser as one HTML payload in a single component, and
+# every card's View/Edit buttons report back through that component's one
+# "action" trigger, so a rerun costs the same few elements however many
+# cards are shown.
+
+PAGE_SIZE_OPTIONS = [12, 24, 48, 96]
+DEFAULT_PAGE_SIZE = 24
+GRID_COLUMNS = 3
+CARD_CACHE_MAX_ENTRIES = 2000
+
+GRID_CSS = f"""
+.card-grid {{
+    display: grid;
+    grid-template-columns: repeat({GRID_COLUMNS}, minmax(0, 1fr));
+    gap: 0 1rem;
+    font-family: "Source Sans Pro", sans-serif;
+}}
+.card-actions {{
+    display: flex;
+    gap: 0.5rem;
+    margin: -0.5rem 0 1.5rem;
+}}
+.card-actions button {{
+    flex: 1;
+    padding: 0.375rem 0.75rem;
+    border: 1px solid #d1d5db;
+    border-radius: 0.5rem;
+    background-color: #ffffff;
+    color: #1f2937;
+    font-size: 0.875rem;
+    cursor: pointer;
+}}
+.card-actions button:hover {{
+    border-color: #ff4b4b;
+    color: #ff4b4b;
+}}
+"""
+
+# One delegated click handler for every button in the grid
+GRID_JS = """
+export default function(component) {
+    const { data, setTriggerValue, parentElement } = component;
+    const grid = parentElement.querySelector(".card-grid");
+    grid.innerHTML = data;
+    grid.onclick = (event) => {
+        const button = event.target.closest("button[data-action]");
+        if (button) {
+            setTriggerValue("action", { action: button.dataset.action, id: button.dataset.id });
+        }
+    };
+}
+"""
+
+card_grid_component = component("card_grid", html='<div class="card-grid"></div>', css=GRID_CSS, js=GRID_JS)
+
+
+def visible_count(state_key, view):
+    """How many cards to show: whole pages loaded so far for the current view.
+
+    `view` identifies the filters and sort; when it changes the grid starts
+    again from the first page. Paging state lives in session_state[state_key].
+    """
+    page_size = st.session_state.get(f"{state_key}_page_size", DEFAULT_PAGE_SIZE)
+    paging = st.session_state.get(state_key)
+    if paging is None or paging["view"] != view or paging["page_size"] != page_size:
+        paging = {"view": view, "page_size": page_size, "pages": 1}
+        st.session_state[state_key] = paging
+    return paging["pages"] * page_size
+
+
+def load_more(state_key):
+    st.session_state[state_key]["pages"] += 1
+
+
+def show_card_grid(records, card_html, state_key, view):
+    """Render the loaded pages of `records` as cards, followed by the paging controls.
+
+    `card_html(record)` returns one card's HTML. Returns the clicked card
+    button as {"action": "view" or "edit", "id": record ID}, or None.
+    """
+    limit = visible_count(state_key, view)
+    visible = records[:limit]
+
+    grid_html = "".join(cached_grid_items(visible, card_html))
+    result = card_grid_component(data=grid_html, key=f"{state_key}_cards", on_action_change=lambda: None)
+
+    remaining = len(records) - len(visible)
+    more_col, size_col = st.columns([4, 1])
+    with more_col:
+        if remaining > 0:
+            page_size = st.session_state[state_key]["page_size"]
+            st.button(
+                f"Load {min(remaining, page_size)} more ({len(visible)} of {len(records)} shown)",
+                key=f"{state_key}_more", on_click=load_more, args=(state_key,), use_container_width=True
+            )
+    with size_col:
+        st.selectbox("Cards per page", PAGE_SIZE_OPTIONS, index=PAGE_SIZE_OPTIONS.index(DEFAULT_PAGE_SIZE),
+                     key=f"{state_key}_page_size", label_visibility="collapsed",
+                     format_func=lambda size: f"{size} per page")
+
+    return result.action
+
+
+# ============ CARD HTML CACHE ============
+
+class CardCache:
+    """Thread-safe LRU cache of rendered card HTML.
+
+    Keys combine the card kind, record ID, a hash of the record's fields
+    and the render date (cards show day-dependent badges), so an edited
+    record or a new day simply misses and the stale entry ages out.
+    """
+
+    def __init__(self, max_entries=CARD_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached HTML for a key, or None"""
+        with self._lock:
+            html = self._entries.get(key)
+            if html is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return html
+
+    def set(self, key, html):
+        with self._lock:
+            self._entries[key] = html
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+@st.cache_resource
+def get_card_cache():
+    """Return the process-wide card HTML cache"""
+    return CardCache()
+
+
+def grid_item_html(record, card_html):
+    """A card plus its View/Edit buttons"""
+    record_id = escape(record.id)
+    return (
+        f'<div>{card_html(record)}<div class="card-actions">'
+        f'<button data-action="view" data-id="{record_id}">View</button>'
+        f'<button data-action="edit" data-id="{record_id}">Edit</button>'
+        f'</div></div>'
+    )
+
+
+def cached_grid_items(records, card_html):
+    """grid_item_html for each record, reusing HTML rendered earlier today for unchanged records"""
+    cache = get_card_cache()
+    today_ord = date.today().toordinal()
+    items = []
+    for record in records:
+        # Pages are re-executed every rerun, so key on the function's name, not the function
+        key = (card_html.__name__, record.id, record.content_hash(), today_ord)
+        html = cache.get(key)
+        if html is None:
+            html = grid_item_html(record, card_html)
+            cache.set(key, html)
+        items.append(html)
+    return items
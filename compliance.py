@@ -0,0 +1,86 @@
+from datetime import date
+
+from report_calendar import last_past_due_month, parse_month, report_window
+
+# ============ REPORT COMPLIANCE ============
+# Each fellow's submitted months are one int bitset: bit i is set when month
+# start + i was submitted. Streaks and consecutive misses are then read off
+# the top of the bitset with bit_length(), instead of walking month labels.
+
+REPORT_FILTERS = {
+    "Gift Card Eligible": "gift_card_eligible",
+    "At Risk": "at_risk",
+    "Reimbursements Paused": "reimbursements_paused"
+}
+
+
+def streak_status(start, end, submitted, last_due):
+    """Streak info for one fellow, matching helpers.calculate_report_streak.
+
+    start/end are the report window's month ordinals, `submitted` the month
+    bitset and `last_due` the latest month whose due date has passed.
+    """
+    past = min(end, last_due) - start + 1  # months already due
+    if past <= 0:
+        streak = missed_count = 0
+    else:
+        mask = (1 << past) - 1
+        submitted &= mask
+        streak = past - (~submitted & mask).bit_length()  # ones below the top bit
+        missed_count = past - submitted.bit_length()      # zeros below the top bit
+    return {
+        "streak": streak,
+        "gift_card_eligible": streak >= 3,
+        "at_risk": missed_count == 1,
+        "reimbursements_paused": missed_count >= 2,
+        "missed_count": missed_count
+    }
+
+
+def roster_compliance(fellows, reports, today=None):
+    """{fellow ID: streak info} for every fellow with monthly reports, in one pass over all reports"""
+    today_ord = (today or date.today()).toordinal()
+    last_due = last_past_due_month(today_ord)
+
+    windows = {}
+    for fellow in fellows:
+        window = report_window(
+            fellow.requires_monthly_reports, fellow.report_start_date,
+            fellow.report_end_month, fellow.fellow_type
+        )
+        # An empty window (start after end) has no required months, like get_required_report_months
+        if window is not None and window[0] <= window[1]:
+            windows[fellow.id] = window
+
+    submitted = dict.fromkeys(windows, 0)
+    for report in reports:
+        if not report.submitted:
+            continue
+        month = parse_month(report.month)
+        if month is None:
+            continue
+        for fellow_id in report.fellow:
+            window = windows.get(fellow_id)
+            if window is not None and window[0] <= month <= window[1]:
+                submitted[fellow_id] |= 1 << (month - window[0])
+
+    return {
+        fellow_id: streak_status(start, end, submitted[fellow_id], last_due)
+        for fellow_id, (start, end) in windows.items()
+    }
+
+
+def compliance_stats(compliance):
+    """Counts for the monthly report stat cards"""
+    return {
+        "reporting": len(compliance),
+        "gift_card_eligible": sum(1 for c in compliance.values() if c["gift_card_eligible"]),
+        "at_risk": sum(1 for c in compliance.values() if c["at_risk"]),
+        "reimbursements_paused": sum(1 for c in compliance.values() if c["reimbursements_paused"])
+    }
+
+
+def fellows_matching(compliance, report_filter):
+    """IDs of fellows whose streak info has the flag behind a REPORT_FILTERS label"""
+    flag = REPORT_FILTERS[report_filter]
+    return {fellow_id for fellow_id, c in compliance.items() if c[flag]}
@@ -0,0 +1,82 @@
+# ============ FACET BITMAPS ============
+# A facet is one filterable field (status, party, cohort, ...). Each
+# (facet, value) pair gets a bitmap, a Python int with bit i set when row i
+# has that value, so applying filters is a chain of &'s and an option's
+# count is one bit_count(). Multi-valued fields (alumni fellow types) set
+# the row's bit in every value they contain.
+
+# Row numbers of the set bits in each possible byte
+BYTE_ROWS = tuple(tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256))
+
+
+def rows_bitmap(rows):
+    """Bitmap with the given row numbers set"""
+    rows = list(rows)
+    if not rows:
+        return 0
+    data = bytearray(max(rows) // 8 + 1)
+    for row in rows:
+        data[row >> 3] |= 1 << (row & 7)
+    return int.from_bytes(data, "little")
+
+
+def bitmap_rows(bits):
+    """Row numbers set in a bitmap, ascending"""
+    rows = []
+    data = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+    for index, byte in enumerate(data):
+        if byte:
+            start = index * 8
+            rows.extend(start + bit for bit in BYTE_ROWS[byte])
+    return rows
+
+
+class FacetIndex:
+    """Bitmaps for every value of every facet in a list of records.
+
+    `facets` maps a filter name to (record attribute, multi-valued?).
+    Selections are {filter name: value}, with None meaning no filter.
+    """
+
+    def __init__(self, records, facets):
+        self.size = len(records)
+        self.all = (1 << self.size) - 1
+        self.bitmaps = {}
+        for name, (attr, multi) in facets.items():
+            rows = {}
+            for row, record in enumerate(records):
+                value = getattr(record, attr)
+                for v in (value if multi else (value,)):
+                    rows.setdefault(v, []).append(row)
+            self.bitmaps[name] = {value: rows_bitmap(value_rows) for value, value_rows in rows.items()}
+
+    def bitmap(self, name, value):
+        return self.bitmaps[name].get(value, 0)
+
+    def select(self, selected, base=None):
+        """Rows matching every active selection, within `base` (default: all rows)"""
+        bits = self.all if base is None else base
+        for name, value in selected.items():
+            if value is not None:
+                bits &= self.bitmap(name, value)
+        return bits
+
+    def counts(self, selected, base=None):
+        """{filter name: {value: count}} for every facet option.
+
+        Each facet's counts apply all the *other* active selections, so they
+        say how many rows picking that option would show. The None entry is
+        the count with the facet itself unfiltered (the "All ..." option).
+        """
+        base = self.all if base is None else base
+        active = {name: self.bitmap(name, value) for name, value in selected.items() if value is not None}
+        counts = {}
+        for name, values in self.bitmaps.items():
+            others = base
+            for other, bits in active.items():
+                if other != name:
+                    others &= bits
+            facet_counts = {value: (bits & others).bit_count() for value, bits in values.items()}
+            facet_counts[None] = others.bit_count()
+            counts[name] = facet_counts
+        return counts
@@ -1,6 +1,19 @@
 import streamlit as st
 import requests
-from datetime import datetime, timedelta
+import functools
+import random
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import date, datetime
+from urllib.parse import quote
+from requests.adapters import HTTPAdapter
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from mirror import AirtableMirror
+from records import Fellow, Alumni, CheckIn, StatusReport
+from report_calendar import is_past_due, parse_month, report_window, required_month_labels
+from compliance import roster_compliance
 
 # ============ AIRTABLE CONFIG ============
 AIRTABLE_API_KEY = st.secrets["airtable"]["api_key"]
@@ -11,356 +24,920 @@ STATUS_REPORTS_TABLE_NAME = "Status Reports"
 ALUMNI_TABLE_NAME = "Alumni"
 GOOGLE_SHEET_URL = "https://docs.google.com/spreadsheets/d/1cUr9l0mmdXkGqy0grAbR4GieNES5-hnRQiNkjnFg19U/edit?usp=sharing"
 
-# ============ HELPER FUNCTIONS ============
+# Connection tuning (optional overrides in the [airtable] secrets section)
+AIRTABLE_API_URL = st.secrets["airtable"].get("api_url", "https://api.airtable.com/v0")
+AIRTABLE_POOL_SIZE = st.secrets["airtable"].get("pool_size", 10)
+AIRTABLE_CONNECT_TIMEOUT = st.secrets["airtable"].get("connect_timeout", 5)
+AIRTABLE_READ_TIMEOUT = st.secrets["airtable"].get("read_timeout", 30)
+AIRTABLE_RATE_LIMIT = st.secrets["airtable"].get("rate_limit", 5)  # requests per second per base
+AIRTABLE_MAX_RETRIES = st.secrets["airtable"].get("max_retries", 4)
+LOADER_MAX_WORKERS = st.secrets["airtable"].get("loader_workers", 4)
+READ_CACHE_TTL = st.secrets["airtable"].get("cache_ttl", 60)
+READ_CACHE_MAX_ENTRIES = st.secrets["airtable"].get("cache_max_entries", 256)
+
+# Optional local SQLite mirror (enabled by setting mirror_path)
+MIRROR_PATH = st.secrets["airtable"].get("mirror_path", "")
+MIRROR_SYNC_INTERVAL = st.secrets["airtable"].get("mirror_sync_interval", 60)
+MIRROR_RECONCILE_INTERVAL = st.secrets["airtable"].get("mirror_reconcile_interval", 3600)
+
+# ============ RATE LIMITING ============
+
+class RateLimiter:
+    """Process-wide token bucket for Airtable's per-base request limit.
+
+    Each caller reserves the next free slot and sleeps until it arrives, so
+    concurrent requests queue in arrival order instead of bursting into 429s.
+    """
+
+    def __init__(self, rate=5, burst=None):
+        self.rate = rate
+        self.capacity = burst or rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.queue_depth = 0
+        self.throttled = 0
+        self.retries = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.last_wait = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self):
+        """Wait for a request slot. Returns the seconds spent waiting."""
+        with self._lock:
+            self._refill()
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            if wait:
+                self.queue_depth += 1
+                self.throttled += 1
+
+        if wait:
+            time.sleep(wait)
+            with self._lock:
+                self.queue_depth -= 1
+                self.total_wait += wait
+                self.max_wait = max(self.max_wait, wait)
+        self.last_wait = wait
+        return wait
+
+    def record_retry(self):
+        with self._lock:
+            self.retries += 1
+
+    def pause(self, seconds):
+        """Hold back every queued and future request for `seconds` (after a 429)"""
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.tokens, -seconds * self.rate)
+
+    def stats(self):
+        """Snapshot of queue depth and wait times, for spotting throttling"""
+        with self._lock:
+            return {
+                "queue_depth": self.queue_depth,
+                "throttled_requests": self.throttled,
+                "retries": self.retries,
+                "total_wait": self.total_wait,
+                "max_wait": self.max_wait,
+                "last_wait": self.last_wait
+            }
+
+
+def backoff_delay(attempt, base=0.5, cap=30):
+    """Exponential backoff with jitter for the given retry attempt (0-based)"""
+    delay = min(cap, base * 2 ** attempt)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def retry_after_seconds(response, attempt):
+    """Delay requested by a Retry-After header, or the backoff delay if absent"""
+    try:
+        return max(0.0, float(response.headers.get("Retry-After")))
+    except (TypeError, ValueError):
+        return backoff_delay(attempt)
 
-def fetch_fellows():
-    """Fetch all fellows from Airtable"""
-    url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_NAME}"
-    headers = {
-        "Authorization": f"Bearer {AIRTABLE_API_KEY}",
-        "Content-Type": "application/json"
-    }
 
-    response = requests.get(url, headers=headers)
+# ============ AIRTABLE CLIENT ============
+
+IDEMPOTENT_METHODS = {"GET", "PATCH", "DELETE"}
 
-    if response.status_code != 200:
-        st.error(f"Failed to fetch data: {response.status_code}")
-        return []
 
-    data = response.json()
-    fellows = []
-
-    for record in data.get("records", []):
-        fields = record.get("fields", {})
-        fellows.append({
-            "id": record["id"],
-            "name": fields.get("Name", ""),
-            "email": fields.get("Email", ""),
-            "phone": fields.get("Phone Number", ""),
-            "fellow_type": fields.get("Fellow Type", ""),
-            "party": fields.get("Party", ""),
-            "office": fields.get("Office", ""),
-            "chamber": fields.get("Chamber", ""),
-            "linkedin": fields.get("LinkedIn", ""),
-            "start_date": fields.get("Start Date", ""),
-            "end_date": fields.get("End Date", ""),
-            "cohort": fields.get("Cohort", ""),
-            "status": fields.get("Status", "Active"),
-            "last_check_in": fields.get("Last Check-in", ""),
-            "prior_role": fields.get("Prior Role", ""),
-            "education": fields.get("Education", ""),
-            "notes": fields.get("Notes", ""),
-            "requires_monthly_reports": fields.get("Requires Monthly Reports", False),
-            "report_start_date": fields.get("Report Start Date", ""),
-            "report_end_month": fields.get("Report End Month", "")
+class AirtableClient:
+    """Pooled keep-alive connection to one Airtable base.
+
+    All helpers go through a single shared instance (see get_airtable_client)
+    so consecutive calls reuse the same TCP/TLS connections instead of paying
+    a fresh handshake per request.
+    """
+
+    def __init__(self, api_key, base_id, api_url=AIRTABLE_API_URL, pool_size=10,
+                 connect_timeout=5, read_timeout=30, rate_limit=5, max_retries=4):
+        self.base_url = f"{api_url.rstrip('/')}/{base_id}"
+        self.timeout = (connect_timeout, read_timeout)
+        self.limiter = RateLimiter(rate_limit)
+        self.max_retries = max_retries
+
+        self.session = requests.Session()
+        self.session.headers.update({
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive"
         })
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def url(self, table, record_id=None):
+        """Build the REST URL for a table or a single record"""
+        url = f"{self.base_url}/{quote(table, safe='')}"
+        if record_id:
+            url += f"/{record_id}"
+        return url
+
+    def request(self, method, table, record_id=None, **kwargs):
+        """Send a request through the rate limiter and pooled session.
+
+        429 responses are retried after Retry-After (pausing every other
+        queued request too). 5xx responses and connection failures are
+        retried with jittered exponential backoff, for idempotent methods
+        only, so a create is never sent twice.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        url = self.url(table, record_id)
+        retryable = method in IDEMPOTENT_METHODS
+
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+            self.limiter.acquire()
+
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if last_attempt or not retryable:
+                    raise
+                self.limiter.record_retry()
+                time.sleep(backoff_delay(attempt))
+                continue
+
+            if last_attempt:
+                return response
+            if response.status_code == 429:
+                self.limiter.record_retry()
+                self.limiter.pause(retry_after_seconds(response, attempt))
+                continue
+            if response.status_code >= 500 and retryable:
+                self.limiter.record_retry()
+                time.sleep(backoff_delay(attempt))
+                continue
+            return response
+
+    def get(self, table, record_id=None, **kwargs):
+        return self.request("GET", table, record_id, **kwargs)
+
+    def post(self, table, **kwargs):
+        return self.request("POST", table, **kwargs)
+
+    def patch(self, table, record_id=None, **kwargs):
+        return self.request("PATCH", table, record_id, **kwargs)
+
+    def delete(self, table, record_id=None, **kwargs):
+        return self.request("DELETE", table, record_id, **kwargs)
+
+
+@st.cache_resource
+def get_airtable_client():
+    """Return the process-wide Airtable client"""
+    return AirtableClient(
+        AIRTABLE_API_KEY,
+        AIRTABLE_BASE_ID,
+        api_url=AIRTABLE_API_URL,
+        pool_size=AIRTABLE_POOL_SIZE,
+        connect_timeout=AIRTABLE_CONNECT_TIMEOUT,
+        read_timeout=AIRTABLE_READ_TIMEOUT,
+        rate_limit=AIRTABLE_RATE_LIMIT,
+        max_retries=AIRTABLE_MAX_RETRIES
+    )
+
+
+def get_airtable_stats():
+    """Rate limiter queue depth and wait times for the shared client"""
+    return get_airtable_client().limiter.stats()
+
+
+# ============ PAGINATION ============
+
+AIRTABLE_PAGE_SIZE = 100  # Airtable's maximum records per list request
+
+
+class AirtableError(Exception):
+    """Raised when Airtable answers a request with a non-200 status"""
+
+    def __init__(self, status_code, text=""):
+        super().__init__(f"Airtable error {status_code}: {text}")
+        self.status_code = status_code
+        self.text = text
+
+
+def iter_pages(table, params=None, page_size=AIRTABLE_PAGE_SIZE):
+    """Yield the records of a table one page at a time, following Airtable's offset cursor.
+
+    Pages are requested lazily, so a caller that stops iterating early never
+    requests the remaining pages. Raises AirtableError on a failed request.
+    """
+    client = get_airtable_client()
+    params = dict(params or {})
+    params["pageSize"] = page_size
 
-    return fellows
+    while True:
+        response = client.get(table, params=params)
+        if response.status_code != 200:
+            raise AirtableError(response.status_code, response.text)
 
+        data = response.json()
+        yield data.get("records", [])
 
-def create_fellow(fellow_data):
-    """Create a new fellow in Airtable"""
-    url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_NAME}"
-    headers = {
-        "Authorization": f"Bearer {AIRTABLE_API_KEY}",
-        "Content-Type": "application/json"
-    }
+        offset = data.get("offset")
+        if not offset:
+            break
+        params["offset"] = offset
+
+
+def iter_records(table, params=None, limit=None):
+    """Yield individual records from iter_pages, stopping after `limit` records if given"""
+    if limit is not None and limit <= 0:
+        return
+    count = 0
+    page_size = min(limit, AIRTABLE_PAGE_SIZE) if limit else AIRTABLE_PAGE_SIZE
+    for page in iter_pages(table, params, page_size=page_size):
+        for record in page:
+            yield record
+            count += 1
+            if limit is not None and count >= limit:
+                return
+
+
+def fetch_record(table, record_id):
+    """Fetch a single record with all of its fields. Raises AirtableError on failure."""
+    mirror = get_mirror()
+    if mirror is not None:
+        sync_mirror(table)
+        record = mirror.get(table, record_id)
+        if record is not None:
+            return record
+
+    response = get_airtable_client().get(table, record_id)
+    if response.status_code != 200:
+        raise AirtableError(response.status_code, response.text)
+    return response.json()
+
+
+# ============ READ CACHE ============
+
+class ReadCache:
+    """Thread-safe TTL + LRU cache of fetch results, keyed by (table, query).
+
+    Entries are grouped by table so a write can drop only the affected table.
+    """
+
+    def __init__(self, ttl=60, max_entries=256):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, table, key):
+        """Return (hit, value) for a cached query"""
+        with self._lock:
+            entry = self._entries.get((table, key))
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[(table, key)]
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end((table, key))
+            self.hits += 1
+            return True, entry[1]
+
+    def set(self, table, key, value):
+        with self._lock:
+            self._entries[(table, key)] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end((table, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, table):
+        """Drop every cached query for one table"""
+        with self._lock:
+            for cache_key in [k for k in self._entries if k[0] == table]:
+                del self._entries[cache_key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+@st.cache_resource
+def get_read_cache():
+    """Return the process-wide read cache"""
+    return ReadCache(ttl=READ_CACHE_TTL, max_entries=READ_CACHE_MAX_ENTRIES)
+
+
+def invalidate_table(table):
+    """Forget cached reads of a table after a successful write to it"""
+    get_read_cache().invalidate(table)
+    mirror = get_mirror()
+    if mirror is not None:
+        mirror.mark_dirty(table)
+
+
+def cached_derived(table, name, sources, build):
+    """Memoize a structure built from fetched lists (an index, columns, ...).
+
+    The result is reused for as long as `sources` are the very same list
+    objects the read cache returned when it was built; once any of them is
+    refetched or the table is invalidated, it is rebuilt on next use.
+    """
+    cache = get_read_cache()
+    hit, entry = cache.get(table, ("derived", name))
+    if hit and len(entry[0]) == len(sources) and all(a is b for a, b in zip(entry[0], sources)):
+        return entry[1]
+
+    value = build(*sources)
+    cache.set(table, ("derived", name), (tuple(sources), value))
+    return value
+
+
+def cached_read(table, error_message=None, single=False, strict=False):
+    """Cache a fetch helper's result under its table and arguments.
+
+    The wrapped function raises AirtableError on failure; failures are
+    reported with st.error (when error_message is given), return [] (None for
+    single-record helpers, and for strict ones whose callers must tell a
+    failed load from an empty one) and are not cached. Cached values are shared
+    between reruns and sessions, so callers must copy them before sorting or
+    modifying in place.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (func.__name__, args, tuple(sorted(kwargs.items())))
+            cache = get_read_cache()
+            hit, value = cache.get(table, key)
+            if hit:
+                return value
+
+            try:
+                value = func(*args, **kwargs)
+            except AirtableError as e:
+                if error_message:
+                    st.error(f"{error_message}: {e.status_code}")
+                return None if single or strict else []
+
+            cache.set(table, key, value)
+            return value
+        return wrapper
+    return decorator
+
+
+# ============ LOCAL MIRROR ============
+
+# Cheap projection per table for the mirror's deleted-record reconciliation
+MIRROR_ID_FIELDS = {
+    AIRTABLE_TABLE_NAME: ("Name",),
+    ALUMNI_TABLE_NAME: ("Name",),
+    CHECKINS_TABLE_NAME: ("Date",),
+    STATUS_REPORTS_TABLE_NAME: ("Month",)
+}
+
+
+@st.cache_resource
+def get_mirror():
+    """Return the process-wide SQLite mirror, or None when mirror_path isn't configured"""
+    if not MIRROR_PATH:
+        return None
+    return AirtableMirror(
+        MIRROR_PATH,
+        sync_interval=MIRROR_SYNC_INTERVAL,
+        reconcile_interval=MIRROR_RECONCILE_INTERVAL
+    )
+
+
+def sync_mirror(table):
+    """Incrementally sync one mirrored table if it is due.
+
+    If Airtable can't be reached and the table was synced before, the
+    existing local copy is served instead of failing the page.
+    """
+    mirror = get_mirror()
+    if not mirror.is_stale(table):
+        return
+    try:
+        mirror.sync(table, lambda params: iter_records(table, params), MIRROR_ID_FIELDS.get(table, ()))
+    except (AirtableError, requests.RequestException):
+        if not mirror.has_table(table):
+            raise
 
-    fields = {
-        "Name": fellow_data.get("name"),
-        "Email": fellow_data.get("email"),
-        "Phone Number": fellow_data.get("phone"),
-        "Fellow Type": fellow_data.get("fellow_type"),
-        "Party": fellow_data.get("party"),
-        "Office": fellow_data.get("office"),
-        "Chamber": fellow_data.get("chamber"),
-        "LinkedIn": fellow_data.get("linkedin"),
-        "Start Date": fellow_data.get("start_date"),
-        "End Date": fellow_data.get("end_date"),
-        "Cohort": fellow_data.get("cohort"),
-        "Status": fellow_data.get("status", "Active"),
-        "Last Check-in": fellow_data.get("last_check_in"),
-        "Prior Role": fellow_data.get("prior_role"),
-        "Education": fellow_data.get("education"),
-        "Notes": fellow_data.get("notes")
-    }
 
-    # Remove empty fields
-    fields = {k: v for k, v in fields.items() if v}
+def table_records(table, params=None):
+    """Records of a whole table: from the local mirror when enabled, otherwise from Airtable.
+
+    The mirror returns every field; list params such as fields[] only apply
+    to the Airtable path, and the decoders fill in any missing fields.
+    """
+    mirror = get_mirror()
+    if mirror is None:
+        return iter_records(table, params)
+    sync_mirror(table)
+    return mirror.records(table)
+
+
+# ============ BATCH WRITES ============
+
+AIRTABLE_BATCH_SIZE = 10  # Airtable's maximum records per create/update/delete request
+
+
+def chunked(items, size=AIRTABLE_BATCH_SIZE):
+    """Split a list into consecutive chunks of at most `size` items"""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def batch_results(response, chunk, ids=None):
+    """Turn one batch response into per-record {"id", "success", "error"} results"""
+    if response.status_code != 200:
+        error = f"Airtable error {response.status_code}: {response.text}"
+        return [{"id": record_id, "success": False, "error": error} for record_id in (ids or [None] * len(chunk))]
+
+    records = response.json().get("records", [])
+    return [{"id": record["id"], "success": True, "error": ""} for record in records]
+
+
+def bulk_create(table, fields_list):
+    """Create records from a list of Airtable field dicts, 10 per request.
+
+    Returns one {"id", "success", "error"} result per input record, in order.
+    Airtable applies each batch atomically, so a failed request marks every
+    record in that batch as failed.
+    """
+    client = get_airtable_client()
+    results = []
+
+    for chunk in chunked(list(fields_list)):
+        response = client.post(table, json={"records": [{"fields": fields} for fields in chunk]})
+        results.extend(batch_results(response, chunk))
+
+    if any(r["success"] for r in results):
+        invalidate_table(table)
+    return results
+
+
+def bulk_update(table, updates):
+    """Patch records from a list of {"id": ..., "fields": {...}} dicts, 10 per request"""
+    client = get_airtable_client()
+    results = []
+
+    for chunk in chunked(list(updates)):
+        response = client.patch(table, json={"records": chunk})
+        results.extend(batch_results(response, chunk, [u["id"] for u in chunk]))
+
+    if any(r["success"] for r in results):
+        invalidate_table(table)
+    return results
+
+
+def bulk_delete(table, record_ids):
+    """Delete records by ID, 10 per request"""
+    client = get_airtable_client()
+    results = []
+
+    for chunk in chunked(list(record_ids)):
+        response = client.delete(table, params={"records[]": chunk})
+        if response.status_code == 200:
+            deleted = response.json().get("records", [])
+            results.extend({"id": r["id"], "success": r.get("deleted", True), "error": ""} for r in deleted)
+        else:
+            results.extend(batch_results(response, chunk, chunk))
+
+    deleted_ids = [r["id"] for r in results if r["success"]]
+    if deleted_ids:
+        mirror = get_mirror()
+        if mirror is not None:
+            mirror.delete(table, deleted_ids)
+        invalidate_table(table)
+    return results
+
+
+def report_bulk_errors(results, message=None):
+    """Show each distinct batch error once with st.error"""
+    for error in dict.fromkeys(r["error"] for r in results if not r["success"]):
+        st.error(f"{message}: {error}" if message else error)
+
+
+# ============ CONCURRENT LOADING ============
+
+@st.cache_resource
+def get_loader_pool():
+    """Return the process-wide worker pool used by load_concurrently"""
+    return ThreadPoolExecutor(max_workers=LOADER_MAX_WORKERS, thread_name_prefix="airtable-loader")
+
+
+def load_concurrently(tasks, timeout=None):
+    """Run several fetches in parallel on the shared worker pool.
+
+    `tasks` maps a name to a callable or a (callable, *args) tuple. Returns
+    (results, errors): results maps each finished task to its value and
+    errors maps each failed or timed-out task to a message, so one slow or
+    broken table doesn't block the others. Workers inherit the caller's
+    Streamlit context so helpers can still call st.error.
+    """
+    ctx = get_script_run_ctx()
+
+    def run(task):
+        add_script_run_ctx(threading.current_thread(), ctx)
+        func, *args = task if isinstance(task, tuple) else (task,)
+        return func(*args)
+
+    pool = get_loader_pool()
+    futures = {name: pool.submit(run, task) for name, task in tasks.items()}
+    wait(futures.values(), timeout=timeout)
+
+    results = {}
+    errors = {}
+    for name, future in futures.items():
+        if not future.done():
+            future.cancel()
+            errors[name] = f"timed out after {timeout}s"
+        elif future.exception() is not None:
+            errors[name] = str(future.exception())
+        else:
+            results[name] = future.result()
+
+    return results, errors
 
-    response = requests.post(url, headers=headers, json={"fields": fields})
+
+# ============ LINKED RECORD QUERIES ============
+
+LINKED_FELLOW_FIELD = "Fellow"
+
+
+def formula_string(value):
+    """Quote a value as an Airtable formula string literal"""
+    escaped = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def linked_fellow_formula(fellow_name, field=LINKED_FELLOW_FIELD):
+    """Build a filterByFormula matching records whose linked Fellow field includes this fellow.
+
+    Inside a formula a linked-record field evaluates to the linked records'
+    primary field (Name), not their record IDs, so the match is on the exact
+    name and callers still confirm the record ID locally.
+    """
+    return f'FIND({formula_string("|" + fellow_name + "|")}, "|" & ARRAYJOIN({{{field}}}, "|") & "|")'
+
+
+@st.cache_resource
+def get_name_formula_support():
+    """Per-table results of probe_name_formula, shared by the whole process"""
+    return {}
+
+
+def probe_name_formula(table):
+    """Whether linked_fellow_formula finds a table's rows by fellow name.
+
+    The formula only works if the Fellows table's primary field is the name.
+    Takes one linked row, looks up its fellow and checks that the formula
+    finds the row again. Returns None when the table has no linked row to try.
+    """
+    link_params = {"fields[]": [LINKED_FELLOW_FIELD]}
+    for record in iter_records(table, link_params, limit=AIRTABLE_PAGE_SIZE):
+        fellow_ids = record.get("fields", {}).get(LINKED_FELLOW_FIELD)
+        if fellow_ids:
+            break
+    else:
+        return None
+
+    fellow_id = fellow_ids[0]
+    name = fetch_record(AIRTABLE_TABLE_NAME, fellow_id).get("fields", {}).get("Name")
+    if not name:
+        return False
+    formula_params = dict(link_params, filterByFormula=linked_fellow_formula(name))
+    return any(
+        fellow_id in record.get("fields", {}).get(LINKED_FELLOW_FIELD, [])
+        for record in iter_records(table, formula_params)
+    )
+
+
+def name_formula_works(table):
+    """Probe a table once per process; until a probe is conclusive, assume the formula works"""
+    support = get_name_formula_support()
+    if table not in support:
+        try:
+            works = probe_name_formula(table)
+        except AirtableError as e:
+            # 422: formula rejected; anything else is transient, so try again next time
+            works = False if e.status_code == 422 else None
+        if works is None:
+            return True
+        support[table] = works
+    return support[table]
+
+
+def iter_fellow_records(table, fellow_id, fellow_name=None, params=None):
+    """Yield the records of a child table (Check-ins, Status Reports) linked to one fellow.
+
+    With the local mirror enabled this is a SQLite query. Otherwise, when the
+    fellow's name is known the lookup is pushed down to Airtable as a
+    filterByFormula, so only that fellow's rows are downloaded. Without a name,
+    or when the formula doesn't work for the table (checked once per process
+    by name_formula_works, or rejected with a 422), it falls back to scanning
+    the whole table. Either way every record is checked against the fellow's ID.
+    """
+    params = dict(params or {})
+
+    mirror = get_mirror()
+    if mirror is not None:
+        sync_mirror(table)
+        yield from mirror.linked_records(
+            table, LINKED_FELLOW_FIELD, fellow_id,
+            order_by=params.get("sort[0][field]"),
+            descending=params.get("sort[0][direction]") == "desc"
+        )
+        return
+
+    if fellow_name and name_formula_works(table):
+        formula_params = dict(params, filterByFormula=linked_fellow_formula(fellow_name))
+        try:
+            for record in iter_records(table, formula_params):
+                if fellow_id in record.get("fields", {}).get(LINKED_FELLOW_FIELD, []):
+                    yield record
+            return
+        except AirtableError as e:
+            # An invalid formula is rejected on the first page, before anything was yielded
+            if e.status_code != 422:
+                raise
+            get_name_formula_support()[table] = False
+
+    for record in iter_records(table, params):
+        if fellow_id in record.get("fields", {}).get(LINKED_FELLOW_FIELD, []):
+            yield record
+
+
+# ============ HELPER FUNCTIONS ============
+
+# Fields rendered by the fellow cards, filters, search and sort options (plus
+# the report schedule, for roster-wide compliance). The modal and edit form load
+# the full record lazily with fetch_fellow.
+FELLOW_CARD_FIELDS = (
+    "Name", "Fellow Type", "Party", "Office", "Chamber",
+    "Start Date", "End Date", "Cohort", "Status", "Last Check-in",
+    "Requires Monthly Reports", "Report Start Date", "Report End Month",
+    "Prior Role", "Education"
+)
+
+
+@cached_read(AIRTABLE_TABLE_NAME, error_message="Failed to fetch data")
+def fetch_fellows(fields=None):
+    """Fetch all fellows from Airtable, optionally only the given fields (e.g. FELLOW_CARD_FIELDS)"""
+    params = {"fields[]": list(fields)} if fields else None
+    return [Fellow.from_record(record) for record in table_records(AIRTABLE_TABLE_NAME, params)]
+
+
+@cached_read(AIRTABLE_TABLE_NAME, error_message="Failed to fetch fellow", single=True)
+def fetch_fellow(record_id):
+    """Fetch one fellow with every field, for the detail modal and edit form"""
+    return Fellow.from_record(fetch_record(AIRTABLE_TABLE_NAME, record_id))
+
+
+def create_fellow(fellow_data):
+    """Create a new fellow in Airtable"""
+    client = get_airtable_client()
+    fields = Fellow.to_fields(fellow_data)
+
+    response = client.post(AIRTABLE_TABLE_NAME, json={"fields": fields})
     if response.status_code != 200:
         st.error(f"Airtable error {response.status_code}: {response.text}")
-    return response.status_code == 200
+        return False
+    invalidate_table(AIRTABLE_TABLE_NAME)
+    return True
 
 
 def update_fellow(record_id, fellow_data):
     """Update an existing fellow in Airtable"""
-    url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_NAME}/{record_id}"
-    headers = {
-        "Authorization": f"Bearer {AIRTABLE_API_KEY}",
-        "Content-Type": "application/json"
-    }
-
-    fields = {
-        "Name": fellow_data.get("name"),
-        "Email": fellow_data.get("email"),
-        "Phone Number": fellow_data.get("phone"),
-        "Fellow Type": fellow_data.get("fellow_type"),
-        "Party": fellow_data.get("party"),
-        "Office": fellow_data.get("office"),
-        "Chamber": fellow_data.get("chamber"),
-        "LinkedIn": fellow_data.get("linkedin"),
-        "Start Date": fellow_data.get("start_date"),
-        "End Date": fellow_data.get("end_date"),
-        "Cohort": fellow_data.get("cohort"),
-        "Status": fellow_data.get("status", "Active"),
-        "Last Check-in": fellow_data.get("last_check_in"),
-        "Prior Role": fellow_data.get("prior_role"),
-        "Education": fellow_data.get("education"),
-        "Notes": fellow_data.get("notes")
-    }
-
-    # Remove empty fields
-    fields = {k: v for k, v in fields.items() if v}
+    client = get_airtable_client()
+    fields = Fellow.to_fields(fellow_data)
 
-    response = requests.patch(url, headers=headers, json={"fields": fields})
+    response = client.patch(AIRTABLE_TABLE_NAME, record_id, json={"fields": fields})
     if response.status_code != 200:
         st.error(f"Airtable error {response.status_code}: {response.text}")
-    return response.status_code == 200
+        return False
+    invalidate_table(AIRTABLE_TABLE_NAME)
+    return True
 
 
 def update_fellow_checkin(record_id, checkin_date):
     """Update just the Last Check-in field for a fellow"""
-    url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_NAME}/{record_id}"
-    headers = {
-        "Authorization": f"Bearer {AIRTABLE_API_KEY}",
-        "Content-Type": "application/json"
-    }
-
+    client = get_airtable_client()
     fields = {"Last Check-in": checkin_date}
 
-    response = requests.patch(url, headers=headers, json={"fields": fields})
+    response = client.patch(AIRTABLE_TABLE_NAME, record_id, json={"fields": fields})
     if response.status_code != 200:
         st.error(f"Failed to update Last Check-in: {response.status_code} - {response.text}")
         return False
+    invalidate_table(AIRTABLE_TABLE_NAME)
     return True
 
 
-def fetch_checkins(fellow_id):
-    """Fetch all check-ins for a specific fellow"""
-    url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{CHECKINS_TABLE_NAME}"
-    headers = {
-        "Authorization": f"Bearer {AIRTABLE_API_KEY}",
-        "Content-Type": "application/json"
-    }
-
-    # Fetch all check-ins sorted by date descending
+@cached_read(CHECKINS_TABLE_NAME)
+def fetch_checkins(fellow_id, fellow_name=None, limit=None):
+    """Fetch check-ins for a specific fellow, newest first (optionally only the newest `limit`)"""
+    # Fetch check-ins sorted by date descending
     params = {
         "sort[0][field]": "Date",
         "sort[0][direction]": "desc"
     }
 
-    response = requests.get(url, headers=headers, params=params)
-
-    if response.status_code != 200:
-        return []
-
-    data = response.json()
     checkins = []
 
-    for record in data.get("records", []):
-        fields = record.get("fields", {})
-        # Fellow field contains array of linked record IDs
-        fellow_ids = fields.get("Fellow", [])
-        # Only include check-ins for this fellow
-        if fellow_id in fellow_ids:
-            checkins.append({
-                "id": record["id"],
-                "fellow": fellow_ids,
-                "date": fields.get("Date", ""),
-                "check_in_type": fields.get("Check-in Type", ""),
-                "notes": fields.get("Notes", ""),
-                "staff_member": fields.get("Staff Member", "")
-            })
+    for record in iter_fellow_records(CHECKINS_TABLE_NAME, fellow_id, fellow_name, params):
+        checkins.append(CheckIn.from_record(record))
+        if limit is not None and len(checkins) >= limit:
+            break
 
     return checkins
 
 
+@cached_read(CHECKINS_TABLE_NAME, error_message="Failed to fetch check-ins")
+def fetch_all_checkins():
+    """Fetch every check-in for every fellow"""
+    return [CheckIn.from_record(record) for record in table_records(CHECKINS_TABLE_NAME)]
+
+
 def add_checkin(checkin_data):
     """Add a new check-in to Airtable"""
-    url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{CHECKINS_TABLE_NAME}"
-    headers = {
-        "Authorization": f"Bearer {AIRTABLE_API_KEY}",
-        "Content-Type": "application/json"
-    }
-
-    fields = {
-        "Fellow": [checkin_data.get("fellow_id")],
-        "Date": checkin_data.get("date"),
-        "Check-in Type": checkin_data.get("check_in_type"),
-        "Notes": checkin_data.get("notes"),
-        "Staff Member": checkin_data.get("staff_member")
-    }
+    return add_checkins([checkin_data])[0]["success"]
 
-    # Remove empty fields
-    fields = {k: v for k, v in fields.items() if v}
 
-    response = requests.post(url, headers=headers, json={"fields": fields})
-    if response.status_code != 200:
-        st.error(f"Airtable error {response.status_code}: {response.text}")
-    return response.status_code == 200
+def add_checkins(checkins):
+    """Add several check-ins, up to 10 per request. Returns per-record results."""
+    results = bulk_create(CHECKINS_TABLE_NAME, [CheckIn.to_fields(c) for c in checkins])
+    report_bulk_errors(results)
+    return results
 
 
 def delete_checkin(record_id):
     """Delete a check-in from Airtable"""
-    url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{CHECKINS_TABLE_NAME}/{record_id}"
-    headers = {
-        "Authorization": f"Bearer {AIRTABLE_API_KEY}",
-        "Content-Type": "application/json"
-    }
+    return delete_checkins([record_id])[0]["success"]
 
-    response = requests.delete(url, headers=headers)
-    if response.status_code != 200:
-        st.error(f"Failed to delete check-in: {response.status_code} - {response.text}")
-        return False
-    return True
 
+def delete_checkins(record_ids):
+    """Delete several check-ins, up to 10 per request. Returns per-record results."""
+    results = bulk_delete(CHECKINS_TABLE_NAME, record_ids)
+    report_bulk_errors(results, "Failed to delete check-in")
+    return results
 
-def fetch_status_reports(fellow_id):
-    """Fetch all status reports for a specific fellow"""
-    url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{STATUS_REPORTS_TABLE_NAME}"
-    headers = {
-        "Authorization": f"Bearer {AIRTABLE_API_KEY}",
-        "Content-Type": "application/json"
-    }
 
+@cached_read(STATUS_REPORTS_TABLE_NAME, strict=True)
+def fetch_status_reports(fellow_id, fellow_name=None):
+    """Fetch all status reports for a specific fellow, or None if the load failed"""
     params = {
         "sort[0][field]": "Month",
         "sort[0][direction]": "asc"
     }
 
-    response = requests.get(url, headers=headers, params=params)
+    records = iter_fellow_records(STATUS_REPORTS_TABLE_NAME, fellow_id, fellow_name, params)
+    return [StatusReport.from_record(record) for record in records]
 
-    if response.status_code != 200:
-        return []
 
-    data = response.json()
-    reports = []
+@cached_read(STATUS_REPORTS_TABLE_NAME, error_message="Failed to fetch status reports", strict=True)
+def fetch_all_status_reports():
+    """Fetch every status report for every fellow, or None if the load failed"""
+    return [StatusReport.from_record(record) for record in table_records(STATUS_REPORTS_TABLE_NAME)]
+
+
+# ============ FELLOW INDEX ============
+
+def report_month_key(report):
+    """Chronological sort key for a status report's "Mon YYYY" month"""
+    month = parse_month(report.get("month", ""))
+    return -1 if month is None else month
+
 
-    for record in data.get("records", []):
-        fields = record.get("fields", {})
-        fellow_ids = fields.get("Fellow", [])
-        if fellow_id in fellow_ids:
-            reports.append({
-                "id": record["id"],
-                "fellow": fellow_ids,
-                "month": fields.get("Month", ""),
-                "submitted": fields.get("Submitted", False),
-                "date_submitted": fields.get("Date Submitted", ""),
-                "notes": fields.get("Notes", "")
-            })
+class FellowIndex:
+    """Check-ins and status reports grouped by linked fellow ID.
 
-    return reports
+    Built once from the full Check-ins and Status Reports tables so per-fellow
+    lookups (modal opens, roster-wide computations) are dict lookups instead
+    of table scans.
+    """
+
+    def __init__(self, checkins, reports):
+        self.checkins = defaultdict(list)
+        for checkin in checkins:
+            for fellow_id in checkin["fellow"]:
+                self.checkins[fellow_id].append(checkin)
+        for rows in self.checkins.values():
+            rows.sort(key=lambda c: c.date_ord, reverse=True)
+
+        self.reports = defaultdict(list)
+        for report in reports:
+            for fellow_id in report["fellow"]:
+                self.reports[fellow_id].append(report)
+        for rows in self.reports.values():
+            rows.sort(key=report_month_key)
+
+    def checkins_for(self, fellow_id):
+        """A fellow's check-ins, newest first"""
+        return self.checkins.get(fellow_id, [])
+
+    def reports_for(self, fellow_id):
+        """A fellow's status reports, oldest month first"""
+        return self.reports.get(fellow_id, [])
+
+    def last_checkin_date(self, fellow_id):
+        """Date of a fellow's most recent logged check-in, or "" """
+        rows = self.checkins.get(fellow_id)
+        return rows[0]["date"] if rows else ""
+
+
+def load_fellow_index():
+    """Load both child tables (in parallel) and return the shared FellowIndex.
+
+    The index is rebuilt only when either underlying table was refetched, so
+    repeated calls within the cache TTL cost nothing.
+    """
+    loaded, _ = load_concurrently({
+        "checkins": fetch_all_checkins,
+        "status_reports": fetch_all_status_reports
+    })
+    checkins = loaded.get("checkins", [])
+    reports = loaded.get("status_reports") or []
+    return cached_derived(CHECKINS_TABLE_NAME, "fellow_index", (checkins, reports), FellowIndex)
+
+
+def load_report_compliance(fellows):
+    """Streak info for every fellow with monthly reports, from one Status Reports load.
+
+    Rebuilt when fellows or status reports are refetched, and at least daily
+    since what counts as overdue depends on the date. Returns None when the
+    Status Reports load failed, rather than counting every report as missing.
+    """
+    reports = fetch_all_status_reports()
+    if reports is None:
+        return None
+    name = ("compliance", date.today().toordinal())
+    return cached_derived(STATUS_REPORTS_TABLE_NAME, name, (fellows, reports), roster_compliance)
 
 
 def add_status_report(report_data):
     """Add a new status report to Airtable"""
-    url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{STATUS_REPORTS_TABLE_NAME}"
-    headers = {
-        "Authorization": f"Bearer {AIRTABLE_API_KEY}",
-        "Content-Type": "application/json"
-    }
+    return add_status_reports([report_data])[0]["success"]
 
-    fields = {
-        "Fellow": [report_data.get("fellow_id")],
-        "Month": report_data.get("month"),
-        "Submitted": report_data.get("submitted", False),
-        "Date Submitted": report_data.get("date_submitted"),
-        "Notes": report_data.get("notes")
-    }
-
-    fields = {k: v for k, v in fields.items() if v is not None and v != ""}
 
-    response = requests.post(url, headers=headers, json={"fields": fields})
-    if response.status_code != 200:
-        st.error(f"Airtable error {response.status_code}: {response.text}")
-        return False
-    return True
+def add_status_reports(reports):
+    """Add several status reports, up to 10 per request. Returns per-record results."""
+    results = bulk_create(STATUS_REPORTS_TABLE_NAME, [StatusReport.to_fields(r) for r in reports])
+    report_bulk_errors(results)
+    return results
 
 
 def update_status_report(record_id, submitted, date_submitted=None):
     """Update a status report's submitted status"""
-    url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{STATUS_REPORTS_TABLE_NAME}/{record_id}"
-    headers = {
-        "Authorization": f"Bearer {AIRTABLE_API_KEY}",
-        "Content-Type": "application/json"
-    }
+    return update_status_reports([record_id], submitted, date_submitted)[0]["success"]
+
 
+def update_status_reports(record_ids, submitted, date_submitted=None):
+    """Set the submitted status of several status reports, up to 10 per request"""
     fields = {"Submitted": submitted}
     if date_submitted:
         fields["Date Submitted"] = date_submitted
 
-    response = requests.patch(url, headers=headers, json={"fields": fields})
-    if response.status_code != 200:
-        st.error(f"Failed to update status report: {response.status_code} - {response.text}")
-        return False
-    return True
+    results = bulk_update(STATUS_REPORTS_TABLE_NAME, [{"id": record_id, "fields": fields} for record_id in record_ids])
+    report_bulk_errors(results, "Failed to update status report")
+    return results
 
 
 def get_required_report_months(fellow):
     """Calculate which months a fellow needs to submit reports for"""
-    if not fellow.get("requires_monthly_reports") or not fellow.get("report_start_date"):
+    window = report_window(
+        fellow.get("requires_monthly_reports"), fellow.get("report_start_date"),
+        fellow.get("report_end_month"), fellow.get("fellow_type")
+    )
+    if window is None:
         return []
+    return list(required_month_labels(*window))
 
-    # Parse start date
-    try:
-        start_date = datetime.strptime(fellow["report_start_date"], "%Y-%m-%d")
-    except:
-        return []
-
-    # Determine end month
-    if fellow.get("report_end_month"):
-        # Manual override
-        end_month_str = fellow["report_end_month"]
-    else:
-        # Calculate from fellow type
-        if "Senior" in (fellow.get("fellow_type") or ""):
-            end_month_str = "Nov 2026"
-        else:
-            end_month_str = "Sep 2026"
-
-    # Parse end month
-    month_map = {
-        "Feb 2026": (2026, 2), "Mar 2026": (2026, 3), "Apr 2026": (2026, 4),
-        "May 2026": (2026, 5), "Jun 2026": (2026, 6), "Jul 2026": (2026, 7),
-        "Aug 2026": (2026, 8), "Sep 2026": (2026, 9), "Oct 2026": (2026, 10),
-        "Nov 2026": (2026, 11), "Dec 2026": (2026, 12)
-    }
-
-    if end_month_str not in month_map:
-        return []
-
-    end_year, end_month = month_map[end_month_str]
-
-    # Generate list of required months
-    required_months = []
-    current_year = start_date.year
-    current_month = start_date.month
-
-    while (current_year < end_year) or (current_year == end_year and current_month <= end_month):
-        month_name = datetime(current_year, current_month, 1).strftime("%b %Y")
-        required_months.append(month_name)
-        current_month += 1
-        if current_month > 12:
-            current_month = 1
-            current_year += 1
 
-    return required_months
-
-
-def calculate_report_streak(reports, required_months):
-    """Calculate current submission streak and status"""
+def calculate_report_streak(reports, required_months, today=None):
+    """Calculate current submission streak and status (as of today, by default)"""
     if not required_months:
         return {"streak": 0, "gift_card_eligible": False, "at_risk": False, "reimbursements_paused": False, "missed_count": 0}
 
@@ -372,24 +949,14 @@ def calculate_report_streak(reports, required_months):
 
     # Calculate streak (consecutive submissions from most recent)
     streak = 0
-    today = datetime.now()
-    current_month_str = today.strftime("%b %Y")
+    today_ord = (today or date.today()).toordinal()
 
-    # Find months where the due date (last day of month) has passed
+    # Months whose due date (last day of month) has passed
     past_months = []
     for month in required_months:
-        try:
-            month_date = datetime.strptime(month, "%b %Y")
-            # Get last day of month (the due date)
-            if month_date.month == 12:
-                last_day = datetime(month_date.year + 1, 1, 1) - timedelta(days=1)
-            else:
-                last_day = datetime(month_date.year, month_date.month + 1, 1) - timedelta(days=1)
-            # Only count as past if due date has passed
-            if last_day < today:
-                past_months.append(month)
-        except:
-            continue
+        month_ord = parse_month(month)
+        if month_ord is not None and is_past_due(month_ord, today_ord):
+            past_months.append(month)
 
     # Count streak from most recent
     for month in reversed(past_months):
@@ -439,132 +1006,68 @@ def calculate_days_until(date_str):
 
 # ============ ALUMNI FUNCTIONS ============
 
-def fetch_alumni():
-    """Fetch all alumni from Airtable"""
-    url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{ALUMNI_TABLE_NAME}"
-    headers = {
-        "Authorization": f"Bearer {AIRTABLE_API_KEY}",
-        "Content-Type": "application/json"
-    }
+# Fields rendered by the alumni cards, filters and sort options. Notes and
+# background are loaded lazily with fetch_alumni_record.
+ALUMNI_CARD_FIELDS = (
+    "Name", "Cohort", "Fellow Type", "Office Served", "Chamber", "Party",
+    "Current Role", "Current Organization", "Sector", "Location", "LinkedIn", "Last Engaged",
+    "Prior Role", "Education"
+)
 
-    all_records = []
-    offset = None
 
-    while True:
-        params = {}
-        if offset:
-            params["offset"] = offset
+@cached_read(ALUMNI_TABLE_NAME, error_message="Failed to fetch alumni data")
+def fetch_alumni(fields=None):
+    """Fetch all alumni from Airtable, optionally only the given fields (e.g. ALUMNI_CARD_FIELDS)"""
+    params = {"fields[]": list(fields)} if fields else None
+    return [Alumni.from_record(record) for record in table_records(ALUMNI_TABLE_NAME, params)]
 
-        response = requests.get(url, headers=headers, params=params)
 
-        if response.status_code != 200:
-            st.error(f"Failed to fetch alumni data: {response.status_code}")
-            return []
-
-        data = response.json()
-
-        for record in data.get("records", []):
-            fields = record.get("fields", {})
-            all_records.append({
-                "id": record["id"],
-                "name": fields.get("Name", ""),
-                "email": fields.get("Email", ""),
-                "phone": fields.get("Phone Number", ""),
-                "cohort": fields.get("Cohort", ""),
-                "fellow_types": fields.get("Fellow Type", []),
-                "office_served": fields.get("Office Served", ""),
-                "chamber": fields.get("Chamber", ""),
-                "party": fields.get("Party", ""),
-                "current_role": fields.get("Current Role", ""),
-                "current_org": fields.get("Current Organization", ""),
-                "sector": fields.get("Sector", ""),
-                "location": fields.get("Location", ""),
-                "linkedin": fields.get("LinkedIn", ""),
-                "last_engaged": fields.get("Last Engaged", ""),
-                "engagement_notes": fields.get("Engagement Notes", ""),
-                "notes": fields.get("Notes", ""),
-                "prior_role": fields.get("Prior Role", ""),
-                "education": fields.get("Education", "")
-            })
-
-        offset = data.get("offset")
-        if not offset:
-            break
-
-    return all_records
+@cached_read(ALUMNI_TABLE_NAME, error_message="Failed to fetch alumni record", single=True)
+def fetch_alumni_record(record_id):
+    """Fetch one alumni record with every field, for the detail modal and edit form"""
+    return Alumni.from_record(fetch_record(ALUMNI_TABLE_NAME, record_id))
 
 
 def create_alumni(alumni_data):
     """Create a new alumni record in Airtable"""
-    url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{ALUMNI_TABLE_NAME}"
-    headers = {
-        "Authorization": f"Bearer {AIRTABLE_API_KEY}",
-        "Content-Type": "application/json"
-    }
-
-    fields = {
-        "Name": alumni_data.get("name"),
-        "Email": alumni_data.get("email"),
-        "Phone Number": alumni_data.get("phone"),
-        "Cohort": alumni_data.get("cohort"),
-        "Fellow Type": alumni_data.get("fellow_types", []),
-        "Office Served": alumni_data.get("office_served"),
-        "Chamber": alumni_data.get("chamber"),
-        "Party": alumni_data.get("party"),
-        "Current Role": alumni_data.get("current_role"),
-        "Current Organization": alumni_data.get("current_org"),
-        "Sector": alumni_data.get("sector"),
-        "Location": alumni_data.get("location"),
-        "LinkedIn": alumni_data.get("linkedin"),
-        "Last Engaged": alumni_data.get("last_engaged"),
-        "Engagement Notes": alumni_data.get("engagement_notes"),
-        "Notes": alumni_data.get("notes"),
-        "Prior Role": alumni_data.get("prior_role"),
-        "Education": alumni_data.get("education")
-    }
+    client = get_airtable_client()
+    fields = Alumni.to_fields(alumni_data)
 
-    # Remove empty fields (but keep Fellow Type even if empty list)
-    fields = {k: v for k, v in fields.items() if v or k == "Fellow Type"}
-
-    response = requests.post(url, headers=headers, json={"fields": fields})
+    response = client.post(ALUMNI_TABLE_NAME, json={"fields": fields})
     if response.status_code != 200:
         st.error(f"Airtable error {response.status_code}: {response.text}")
-    return response.status_code == 200
+        return False
+    invalidate_table(ALUMNI_TABLE_NAME)
+    return True
 
 
 def update_alumni(record_id, alumni_data):
     """Update an existing alumni record in Airtable"""
-    url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{ALUMNI_TABLE_NAME}/{record_id}"
-    headers = {
-        "Authorization": f"Bearer {AIRTABLE_API_KEY}",
-        "Content-Type": "application/json"
-    }
-
-    fields = {
-        "Name": alumni_data.get("name"),
-        "Email": alumni_data.get("email"),
-        "Phone Number": alumni_data.get("phone"),
-        "Cohort": alumni_data.get("cohort"),
-        "Fellow Type": alumni_data.get("fellow_types", []),
-        "Office Served": alumni_data.get("office_served"),
-        "Chamber": alumni_data.get("chamber"),
-        "Party": alumni_data.get("party"),
-        "Current Role": alumni_data.get("current_role"),
-        "Current Organization": alumni_data.get("current_org"),
-        "Sector": alumni_data.get("sector"),
-        "Location": alumni_data.get("location"),
-        "LinkedIn": alumni_data.get("linkedin"),
-        "Last Engaged": alumni_data.get("last_engaged"),
-        "Engagement Notes": alumni_data.get("engagement_notes"),
-        "Notes": alumni_data.get("notes"),
-        "Prior Role": alumni_data.get("prior_role"),
-        "Education": alumni_data.get("education")
-    }
-
-    # Remove empty fields (but keep Fellow Type even if empty list)
-    fields = {k: v for k, v in fields.items() if v or k == "Fellow Type"}
+    client = get_airtable_client()
+    fields = Alumni.to_fields(alumni_data)
 
-    response = requests.patch(url, headers=headers, json={"fields": fields})
+    response = client.patch(ALUMNI_TABLE_NAME, record_id, json={"fields": fields})
     if response.status_code != 200:
         st.error(f"Airtable error {response.status_code}: {response.text}")
-    return response.status_code == 200
+        return False
+    invalidate_table(ALUMNI_TABLE_NAME)
+    return True
+
+
+# ============ FLASH MESSAGES ============
+# A confirmation shown right before st.rerun() is wiped by the rerun, so
+# writes queue it in session_state instead and the next run (full page or
+# fragment) shows it as a toast.
+
+FLASH_ICONS = {"success": "✅", "warning": "⚠️"}
+
+
+def flash(message, kind="success"):
+    """Queue a message to show as a toast on the next run"""
+    st.session_state.setdefault("flash_messages", []).append((message, kind))
+
+
+def show_flash_messages():
+    """Show and clear any queued flash messages"""
+    for message, kind in st.session_state.pop("flash_messages", []):
+        st.toast(message, icon=FLASH_ICONS.get(kind))
@@ -0,0 +1,209 @@
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from report_calendar import parse_month
+
+# ============ MIRROR CONFIG ============
+SYNC_CLOCK_SKEW = timedelta(seconds=30)  # overlap between incremental syncs
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    tbl TEXT NOT NULL,
+    id TEXT NOT NULL,
+    fields TEXT NOT NULL,
+    PRIMARY KEY (tbl, id)
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    tbl TEXT PRIMARY KEY,
+    watermark TEXT,
+    synced_at REAL NOT NULL DEFAULT 0,
+    reconciled_at REAL NOT NULL DEFAULT 0
+);
+"""
+
+
+def sort_key(value):
+    """SQL sort key for a field value: "Mon YYYY" labels by month, anything else as is"""
+    month = parse_month(value) if isinstance(value, str) else None
+    return value if month is None else month
+
+
+def modified_since_formula(watermark):
+    """filterByFormula selecting records modified after an ISO timestamp"""
+    return f'IS_AFTER(LAST_MODIFIED_TIME(), DATETIME_PARSE("{watermark}"))'
+
+
+# ============ SQLITE MIRROR ============
+
+class AirtableMirror:
+    """Local SQLite replica of Airtable tables, kept current by incremental sync.
+
+    The first sync of a table pulls every record. Later syncs only pull
+    records whose LAST_MODIFIED_TIME() is after the previous sync, and every
+    `reconcile_interval` seconds the full list of record IDs is compared to
+    drop records deleted in Airtable. Reads never touch the network; callers
+    decide when to sync (see helpers.sync_mirror).
+    """
+
+    def __init__(self, path, sync_interval=60, reconcile_interval=3600):
+        self.path = path
+        self.sync_interval = sync_interval
+        self.reconcile_interval = reconcile_interval
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.create_function("sort_key", 1, sort_key, deterministic=True)
+        # Ad-hoc queries get their own read-only connection
+        self._read_lock = threading.Lock()
+        self._read_conn = None
+        # One sync at a time per table
+        self._sync_locks = {}
+
+    def _state(self, table):
+        row = self._conn.execute(
+            "SELECT watermark, synced_at, reconciled_at FROM sync_state WHERE tbl = ?", (table,)
+        ).fetchone()
+        return row or (None, 0, 0)
+
+    def has_table(self, table):
+        """Whether the table has completed at least one full sync"""
+        with self._lock:
+            return self._state(table)[0] is not None
+
+    def is_stale(self, table):
+        with self._lock:
+            return time.time() - self._state(table)[1] >= self.sync_interval
+
+    def _sync_lock(self, table):
+        with self._lock:
+            return self._sync_locks.setdefault(table, threading.Lock())
+
+    def mark_dirty(self, table):
+        """Force the next sync of a table (e.g. after a write through the API)"""
+        with self._lock:
+            self._conn.execute("UPDATE sync_state SET synced_at = 0 WHERE tbl = ?", (table,))
+            self._conn.commit()
+
+    def sync(self, table, list_records, id_fields=()):
+        """Bring a table up to date, if it is stale (see mark_dirty).
+
+        `list_records(params)` yields raw Airtable records for the given list
+        params (filterByFormula, fields[]); `id_fields` is a short projection
+        used when only record IDs are needed for delete reconciliation.
+        Returns the number of records written or removed.
+
+        Airtable is queried without holding the lock, so reads of the mirror
+        carry on during a sync; the lock is only taken to apply the results.
+        Only one sync of a table runs at a time: while one is in flight other
+        callers return at once and read the current copy, or, if the table
+        has never been synced, wait for it to finish.
+        """
+        sync_lock = self._sync_lock(table)
+        if not sync_lock.acquire(blocking=not self.has_table(table)):
+            return 0
+        try:
+            if not self.is_stale(table):
+                return 0  # synced by another caller while this one waited
+            return self._sync(table, list_records, id_fields)
+        finally:
+            sync_lock.release()
+
+    def _sync(self, table, list_records, id_fields):
+        with self._lock:
+            watermark, _, reconciled_at = self._state(table)
+        started = datetime.now(timezone.utc)
+        now = time.time()
+
+        live_ids = None
+        if watermark is None:
+            records = list(list_records({}))
+        else:
+            params = {"filterByFormula": modified_since_formula(watermark)}
+            records = list(list_records(params))
+            if now - reconciled_at >= self.reconcile_interval:
+                params = {"fields[]": list(id_fields)} if id_fields else {}
+                live_ids = {record["id"] for record in list_records(params)}
+
+        with self._lock:
+            changed = 0
+            if watermark is None:
+                self._conn.execute("DELETE FROM records WHERE tbl = ?", (table,))
+                changed += self._upsert(table, records)
+                reconciled_at = now
+            else:
+                changed += self._upsert(table, records)
+                if live_ids is not None:
+                    changed += self._remove_missing(table, live_ids)
+                    reconciled_at = now
+
+            new_watermark = (started - SYNC_CLOCK_SKEW).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state (tbl, watermark, synced_at, reconciled_at) VALUES (?, ?, ?, ?)",
+                (table, new_watermark, now, reconciled_at)
+            )
+            self._conn.commit()
+            return changed
+
+    def _upsert(self, table, records):
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO records (tbl, id, fields) VALUES (?, ?, ?)",
+            [(table, r["id"], json.dumps(r.get("fields", {}))) for r in records]
+        )
+        return len(records)
+
+    def delete(self, table, record_ids):
+        """Drop records deleted through the API (incremental syncs can't see deletions)"""
+        with self._lock:
+            self._conn.executemany("DELETE FROM records WHERE tbl = ? AND id = ?", [(table, i) for i in record_ids])
+            self._conn.commit()
+
+    def _remove_missing(self, table, live_ids):
+        local_ids = {row[0] for row in self._conn.execute("SELECT id FROM records WHERE tbl = ?", (table,))}
+        deleted = local_ids - live_ids
+        self._conn.executemany("DELETE FROM records WHERE tbl = ? AND id = ?", [(table, i) for i in deleted])
+        return len(deleted)
+
+    # ---------- reads ----------
+
+    def records(self, table):
+        """All mirrored records of a table, in Airtable's {"id", "fields"} shape"""
+        with self._lock:
+            rows = self._conn.execute("SELECT id, fields FROM records WHERE tbl = ?", (table,)).fetchall()
+        return [{"id": record_id, "fields": json.loads(fields)} for record_id, fields in rows]
+
+    def get(self, table, record_id):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fields FROM records WHERE tbl = ? AND id = ?", (table, record_id)
+            ).fetchone()
+        return {"id": record_id, "fields": json.loads(row[0])} if row else None
+
+    def linked_records(self, table, link_field, record_id, order_by=None, descending=False):
+        """Records whose linked-record field contains `record_id`, optionally sorted by a field
+        ("Mon YYYY" month labels sort by month, not alphabetically)"""
+        sql = (
+            "SELECT r.id, r.fields FROM records r, json_each(r.fields, ?) link "
+            "WHERE r.tbl = ? AND link.value = ?"
+        )
+        params = [f'$."{link_field}"', table, record_id]
+        if order_by:
+            sql += f" ORDER BY sort_key(json_extract(r.fields, ?)) {'DESC' if descending else 'ASC'}"
+            params.append(f'$."{order_by}"')
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [{"id": rid, "fields": json.loads(fields)} for rid, fields in rows]
+
+    def query(self, sql, params=()):
+        """Run a read-only SQL query (for analytics) against the mirror.
+
+        Uses a separate connection opened with mode=ro, so a statement that
+        writes fails with sqlite3.OperationalError instead of changing the mirror.
+        """
+        with self._read_lock:
+            if self._read_conn is None:
+                self._read_conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+            return self._read_conn.execute(sql, params).fetchall()
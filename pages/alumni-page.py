@@ -1,9 +1,13 @@
 import streamlit as st
 from datetime import datetime
+from html import escape
 from helpers import (
-    fetch_alumni, create_alumni, update_alumni,
-    calculate_days_since
+    fetch_alumni, fetch_alumni_record, create_alumni, update_alumni,
+    cached_derived, flash, show_flash_messages, ALUMNI_CARD_FIELDS, ALUMNI_TABLE_NAME
 )
+from card_grid import show_card_grid
+from records import enrich
+from roster import alumni_roster, option_label, selection, ALUMNI_SORT_OPTIONS, ALUMNI_DEFAULT_SORT
 
 # ============ AUTH GUARD ============
 if not st.session_state.get("authenticated"):
@@ -20,6 +24,15 @@ if "alumni_modal_id" not in st.session_state:
 if "alumni_trigger_modal" not in st.session_state:
     st.session_state.alumni_trigger_modal = False
 
+# Roster filter name -> session state key of its selectbox
+FILTER_KEYS = {
+    "fellow_type": "alumni_type_filter",
+    "sector": "alumni_sector_filter",
+    "party": "alumni_party_filter",
+    "chamber": "alumni_chamber_filter",
+    "cohort": "alumni_cohort_filter"
+}
+
 # ============ CUSTOM CSS ============
 st.markdown("""
 <style>
@@ -507,6 +520,9 @@ def is_any_aisf(fellow_types):
 # ============ MAIN APP ============
 
 def main():
+    # Confirmations queued by the write that triggered this rerun
+    show_flash_messages()
+
     # Header
     st.image("TechCongress Logo (black).png", width=200)
     col1, col2 = st.columns([4, 1])
@@ -528,12 +544,14 @@ def main():
 
     # Fetch data
     with st.spinner("Loading alumni..."):
-        alumni_list = fetch_alumni()
+        alumni_list = enrich(fetch_alumni(ALUMNI_CARD_FIELDS))
 
     # Show modal if an alumni is selected AND trigger is True
     if st.session_state.alumni_modal_id and st.session_state.alumni_trigger_modal:
-        selected_alumni = next((a for a in alumni_list if a["id"] == st.session_state.alumni_modal_id), None)
+        # Cards only carry the card fields; load the full record for the modal
+        selected_alumni = fetch_alumni_record(st.session_state.alumni_modal_id)
         if selected_alumni:
+            enrich([selected_alumni])
             show_alumni_modal(selected_alumni)
         st.session_state.alumni_trigger_modal = False
 
@@ -543,12 +561,12 @@ def main():
             show_alumni_form()
         return
 
+    # Columns/indexes for filtering and sorting, rebuilt only when alumni are refetched
+    roster = cached_derived(ALUMNI_TABLE_NAME, "alumni_roster", (alumni_list,), alumni_roster)
+
     # Calculate stats
-    total = len(alumni_list)
-    govt = len([a for a in alumni_list if a.get("sector") == "Government"])
-    private = len([a for a in alumni_list if a.get("sector") == "Private"])
-    nonprofit_academia = len([a for a in alumni_list if a.get("sector") in ["Nonprofit", "Academia"]])
-    policy = len([a for a in alumni_list if a.get("sector") == "Policy/Think Tank"])
+    stats = roster.stats()
+    total = stats["total"]
 
     # Stats row
     st.markdown("---")
@@ -557,105 +575,80 @@ def main():
     with col1:
         st.metric("Total Alumni", total)
     with col2:
-        st.metric("Government", govt)
+        st.metric("Government", stats["govt"])
     with col3:
-        st.metric("Private Sector", private)
+        st.metric("Private Sector", stats["private"])
     with col4:
-        st.metric("Nonprofit / Academia", nonprofit_academia)
+        st.metric("Nonprofit / Academia", stats["nonprofit_academia"])
     with col5:
-        st.metric("Policy / Think Tank", policy)
+        st.metric("Policy / Think Tank", stats["policy"])
 
     st.markdown("---")
 
+    # Current filter values come from the widgets' session state, so each
+    # selectbox can show its option counts under the other active filters
+    # (fuzzy results are a ranked top list, so counts ignore a fuzzy search)
+    filters = {name: selection(st.session_state.get(key)) for name, key in FILTER_KEYS.items()}
+    search = st.session_state.get("alumni_search", "")
+    fuzzy = st.session_state.get("alumni_fuzzy", False)
+    counts = roster.facet_counts(search=None if fuzzy else search, **filters)
+
     # Filters
     with st.expander("Filters", expanded=True):
         col1, col2, col3, col4, col5 = st.columns(5)
 
         with col1:
-            search = st.text_input("Search", placeholder="Name, org, or office...")
+            st.text_input("Search", placeholder="Name, org, role, location...", key="alumni_search")
         with col2:
             fellow_type_options = ["All Types", "Congressional Innovation Fellow", "Senior Congressional Innovation Fellow", "Congressional Innovation Scholar", "Congressional Digital Service Fellow", "AI Security Fellow"]
-            fellow_type_filter = st.selectbox("Fellow Type", fellow_type_options)
+            st.selectbox("Fellow Type", fellow_type_options, key=FILTER_KEYS["fellow_type"],
+                         format_func=option_label(counts["fellow_type"]))
         with col3:
             sector_options = ["All Sectors", "Government", "Nonprofit", "Academia", "Private", "Policy/Think Tank"]
-            sector_filter = st.selectbox("Sector", sector_options)
+            st.selectbox("Sector", sector_options, key=FILTER_KEYS["sector"],
+                         format_func=option_label(counts["sector"]))
         with col4:
             party_options = ["All Parties", "Democrat", "Republican", "Independent"]
-            party_filter = st.selectbox("Party", party_options)
+            st.selectbox("Party", party_options, key=FILTER_KEYS["party"],
+                         format_func=option_label(counts["party"]))
         with col5:
             chamber_options = ["All Chambers", "Senate", "House", "Executive Branch"]
-            chamber_filter = st.selectbox("Chamber", chamber_options)
+            st.selectbox("Chamber", chamber_options, key=FILTER_KEYS["chamber"],
+                         format_func=option_label(counts["chamber"]))
 
-        # Cohort filter + Sort
-        col1, col2 = st.columns(2)
+        # Cohort filter + Sort + Fuzzy search
+        col1, col2, col3 = st.columns([2, 2, 1])
         with col1:
-            cohorts = sorted(set([a["cohort"] for a in alumni_list if a.get("cohort")]), reverse=True)
-            cohort_options = ["All Cohorts"] + cohorts
-            cohort_filter = st.selectbox("Cohort", cohort_options)
+            st.selectbox("Cohort", ["All Cohorts"] + roster.cohorts(), key=FILTER_KEYS["cohort"],
+                         format_func=option_label(counts["cohort"]))
         with col2:
-            sort_options = ["Cohort (newest first)", "Cohort (oldest first)", "Name (A-Z)", "Name (Z-A)", "Last Engaged (oldest first)", "Last Engaged (newest first)", "Organization (A-Z)", "Sector"]
-            sort_by = st.selectbox("Sort by", sort_options, index=0)
-
-    # Apply filters
-    filtered = alumni_list.copy()
-
-    if search:
-        search_lower = search.lower()
-        filtered = [a for a in filtered if
-            search_lower in a["name"].lower() or
-            search_lower in (a.get("current_org") or "").lower() or
-            search_lower in (a.get("office_served") or "").lower() or
-            search_lower in (a.get("current_role") or "").lower()]
-
-    if fellow_type_filter != "All Types":
-        filtered = [a for a in filtered if fellow_type_filter in (a.get("fellow_types") or [])]
-
-    if sector_filter != "All Sectors":
-        filtered = [a for a in filtered if a.get("sector") == sector_filter]
-
-    if party_filter != "All Parties":
-        filtered = [a for a in filtered if a.get("party") == party_filter]
-
-    if chamber_filter != "All Chambers":
-        filtered = [a for a in filtered if a.get("chamber") == chamber_filter]
-
-    if cohort_filter != "All Cohorts":
-        filtered = [a for a in filtered if a.get("cohort") == cohort_filter]
-
-    # Sort
-    if sort_by == "Cohort (newest first)":
-        filtered.sort(key=lambda a: a.get("cohort") or "", reverse=True)
-    elif sort_by == "Cohort (oldest first)":
-        filtered.sort(key=lambda a: a.get("cohort") or "")
-    elif sort_by == "Name (A-Z)":
-        filtered.sort(key=lambda a: a["name"].lower())
-    elif sort_by == "Name (Z-A)":
-        filtered.sort(key=lambda a: a["name"].lower(), reverse=True)
-    elif sort_by == "Last Engaged (oldest first)":
-        filtered.sort(key=lambda a: a.get("last_engaged") or "0000-00-00")
-    elif sort_by == "Last Engaged (newest first)":
-        filtered.sort(key=lambda a: a.get("last_engaged") or "0000-00-00", reverse=True)
-    elif sort_by == "Organization (A-Z)":
-        filtered.sort(key=lambda a: (a.get("current_org") or "").lower())
-    elif sort_by == "Sector":
-        filtered.sort(key=lambda a: a.get("sector") or "")
+            sort_by = st.selectbox("Sort by", ALUMNI_SORT_OPTIONS, index=ALUMNI_SORT_OPTIONS.index(ALUMNI_DEFAULT_SORT))
+        with col3:
+            st.checkbox("Fuzzy search", key="alumni_fuzzy",
+                        help="Tolerate typos in the search box and show the closest matches first")
+
+    # Apply filters and sort
+    filtered = roster.query(sort_by, search=search, fuzzy=fuzzy, **filters)
 
     # Show count
-    st.caption(f"Showing {len(filtered)} of {total} alumni")
+    if fuzzy and search:
+        st.caption(f"Showing the {len(filtered)} closest matches for \"{search}\"")
+    else:
+        st.caption(f"Showing {len(filtered)} of {total} alumni")
 
     # Show add/edit form if needed
     if st.session_state.alumni_show_add_form or st.session_state.alumni_editing:
         show_alumni_form()
 
-    # Display alumni in cards
-    cols = st.columns(3)
-    for idx, alumni in enumerate(filtered):
-        with cols[idx % 3]:
-            show_alumni_card(alumni)
+    # Display alumni in cards, a page at a time
+    view = (search, fuzzy, tuple(filters.items()), sort_by)
+    action = show_card_grid(filtered, alumni_card_html, "alumni_grid", view)
+    if action:
+        handle_card_action(action)
 
 
-def show_alumni_card(alumni):
-    """Display an alumni card."""
+def alumni_card_html(alumni):
+    """HTML for an alumni card."""
     fellow_types = alumni.get("fellow_types") or []
     aisf = is_any_aisf(fellow_types)
 
@@ -681,7 +674,7 @@ def show_alumni_card(alumni):
     sector_html = ""
     if alumni.get("sector"):
         s_bg, s_text = get_sector_badge(alumni["sector"])
-        sector_html = f'<span style="display:inline-block;padding:0.25rem 0.75rem;border-radius:9999px;font-size:0.75rem;font-weight:500;background-color:{s_bg};color:{s_text};margin-top:0.25rem;">{alumni["sector"]}</span>'
+        sector_html = f'<span style="display:inline-block;padding:0.25rem 0.75rem;border-radius:9999px;font-size:0.75rem;font-weight:500;background-color:{s_bg};color:{s_text};margin-top:0.25rem;">{escape(alumni["sector"])}</span>'
 
     # Current role line
     role_html = ""
@@ -692,39 +685,37 @@ def show_alumni_card(alumni):
         if alumni.get("current_org"):
             role_parts.append(alumni["current_org"])
         role_text = " @ ".join(role_parts) if len(role_parts) == 2 else role_parts[0]
-        role_html = f'<div style="color:#374151;font-size:0.875rem;margin-bottom:0.25rem;font-weight:500;">{role_text}</div>'
+        role_html = f'<div style="color:#374151;font-size:0.875rem;margin-bottom:0.25rem;font-weight:500;">{escape(role_text)}</div>'
 
     # Office served
     office_html = ""
     if alumni.get("office_served"):
-        office_html = f'<div style="color:#6b7280;font-size:0.8rem;margin-bottom:0.25rem;">Served: {alumni["office_served"]}</div>'
+        office_html = f'<div style="color:#6b7280;font-size:0.8rem;margin-bottom:0.25rem;">Served: {escape(alumni["office_served"])}</div>'
 
     # Location
     location_html = ""
     if alumni.get("location"):
-        location_html = f'<div style="color:#6b7280;font-size:0.8rem;">{alumni["location"]}</div>'
+        location_html = f'<div style="color:#6b7280;font-size:0.8rem;">{escape(alumni["location"])}</div>'
 
     # LinkedIn icon
     linkedin_html = ""
     if alumni.get("linkedin"):
-        linkedin_html = f'<a href="{alumni["linkedin"]}" target="_blank" style="color:#0077b5;font-size:0.8rem;text-decoration:none;">LinkedIn</a>'
+        linkedin_html = f'<a href="{escape(alumni["linkedin"])}" target="_blank" style="color:#0077b5;font-size:0.8rem;text-decoration:none;">LinkedIn</a>'
 
-    card_html = f'<div style="background-color:white;padding:1.25rem;border-radius:0.75rem;border:1px solid #e5e7eb;margin-bottom:1rem;box-shadow:0 1px 3px rgba(0,0,0,0.1);"><div style="font-weight:600;font-size:1.1rem;margin-bottom:0.25rem;color:#1f2937;">{alumni["name"]}</div><div style="color:#6b7280;font-size:0.875rem;margin-bottom:0.5rem;">Cohort: {alumni.get("cohort") or "N/A"}</div>{role_html}<div style="margin-bottom:0.5rem;">{type_badges_html}{party_html}</div>{office_html}<div style="margin-bottom:0.25rem;">{sector_html}</div>{location_html}{linkedin_html}</div>'
+    card_html = f'<div style="background-color:white;padding:1.25rem;border-radius:0.75rem;border:1px solid #e5e7eb;margin-bottom:1rem;box-shadow:0 1px 3px rgba(0,0,0,0.1);"><div style="font-weight:600;font-size:1.1rem;margin-bottom:0.25rem;color:#1f2937;">{escape(alumni["name"])}</div><div style="color:#6b7280;font-size:0.875rem;margin-bottom:0.5rem;">Cohort: {escape(alumni.get("cohort") or "N/A")}</div>{role_html}<div style="margin-bottom:0.5rem;">{type_badges_html}{party_html}</div>{office_html}<div style="margin-bottom:0.25rem;">{sector_html}</div>{location_html}{linkedin_html}</div>'
 
-    st.markdown(card_html, unsafe_allow_html=True)
+    return card_html
 
-    # Action buttons
-    col1, col2 = st.columns(2)
-    with col1:
-        if st.button("View", key=f"alumni_view_{alumni['id']}", use_container_width=True):
-            st.session_state.alumni_modal_id = alumni["id"]
-            st.session_state.alumni_trigger_modal = True
-            st.rerun()
-    with col2:
-        if st.button("Edit", key=f"alumni_edit_{alumni['id']}", use_container_width=True):
-            st.session_state.alumni_editing = alumni
-            st.session_state.alumni_show_add_form = False
-            st.rerun()
+
+def handle_card_action(action):
+    """Open the modal or edit form for a View/Edit click in the card grid"""
+    if action["action"] == "view":
+        st.session_state.alumni_modal_id = action["id"]
+        st.session_state.alumni_trigger_modal = True
+    elif action["action"] == "edit":
+        st.session_state.alumni_editing = fetch_alumni_record(action["id"])
+        st.session_state.alumni_show_add_form = False
+    st.rerun()
 
 
 @st.dialog("Alumni Details", width="large")
@@ -816,7 +807,7 @@ def show_alumni_modal(alumni):
 
         st.markdown("### Engagement")
         if alumni.get("last_engaged"):
-            days_ago = calculate_days_since(alumni["last_engaged"])
+            days_ago = alumni.days_since_engaged
             st.markdown(f"**Last Engaged:** {alumni['last_engaged']} ({days_ago} days ago)")
         else:
             st.caption("No engagement date recorded")
@@ -962,7 +953,7 @@ def show_alumni_form():
                 if is_editing:
                     success = update_alumni(alumni["id"], alumni_data)
                     if success:
-                        st.success("Alumni updated successfully!")
+                        flash("Alumni updated successfully!")
                         st.session_state.alumni_editing = None
                         st.rerun()
                     else:
@@ -970,7 +961,7 @@ def show_alumni_form():
                 else:
                     success = create_alumni(alumni_data)
                     if success:
-                        st.success("Alumni added successfully!")
+                        flash("Alumni added successfully!")
                         st.session_state.alumni_show_add_form = False
                         st.rerun()
                     else:
@@ -1,18 +1,27 @@
 import streamlit as st
-from datetime import datetime, timedelta
+from datetime import date, datetime
+from html import escape
 from helpers import (
-    fetch_fellows, create_fellow, update_fellow, update_fellow_checkin,
-    fetch_checkins, add_checkin, delete_checkin,
-    fetch_status_reports, add_status_report, update_status_report,
-    get_required_report_months, calculate_report_streak,
-    calculate_days_since, calculate_days_until, GOOGLE_SHEET_URL
+    fetch_fellows, fetch_fellow, create_fellow, update_fellow, update_fellow_checkin,
+    add_checkin, delete_checkin, add_status_reports, update_status_reports,
+    get_required_report_months, calculate_report_streak, load_report_compliance,
+    fetch_checkins, fetch_status_reports, fetch_all_status_reports, load_concurrently,
+    cached_derived, flash, show_flash_messages,
+    FELLOW_CARD_FIELDS, GOOGLE_SHEET_URL, AIRTABLE_TABLE_NAME
 )
+from card_grid import show_card_grid
+from compliance import REPORT_FILTERS, compliance_stats, fellows_matching
+from records import enrich
+from report_calendar import due_date, is_past_due, parse_month
+from roster import fellow_roster, option_label, selection, FELLOW_SORT_OPTIONS, FELLOW_DEFAULT_SORT
 
 # ============ AUTH GUARD ============
 if not st.session_state.get("authenticated"):
     st.warning("Please log in first.")
     st.stop()
 
+MODAL_LOAD_TIMEOUT = 30  # seconds to wait for the modal's Airtable loads
+
 # ============ SESSION STATE ============
 if "show_add_form" not in st.session_state:
     st.session_state.show_add_form = False
@@ -25,6 +34,15 @@ if "show_checkin_form" not in st.session_state:
 if "trigger_modal" not in st.session_state:
     st.session_state.trigger_modal = False
 
+# Roster filter name -> session state key of its selectbox
+FILTER_KEYS = {
+    "status": "fellow_status_filter",
+    "fellow_type": "fellow_type_filter",
+    "party": "fellow_party_filter",
+    "chamber": "fellow_chamber_filter",
+    "cohort": "fellow_cohort_filter"
+}
+
 # ============ CUSTOM CSS ============
 st.markdown("""
 <style>
@@ -473,6 +491,9 @@ st.markdown("""
 # ============ MAIN APP ============
 
 def main():
+    # Confirmations queued by the write that triggered this rerun
+    show_flash_messages()
+
     # Header
     st.image("TechCongress Logo (black).png", width=200)
     col1, col2 = st.columns([4, 1])
@@ -493,13 +514,23 @@ def main():
             st.rerun()
 
     # Fetch data
+    # Status reports (for roster compliance) load alongside the fellows;
+    # load_report_compliance then reads them from the cache
     with st.spinner("Loading fellows..."):
-        fellows = fetch_fellows()
+        loaded, load_errors = load_concurrently({
+            "fellows": (fetch_fellows, FELLOW_CARD_FIELDS),
+            "status_reports": fetch_all_status_reports
+        })
+        for name, error in load_errors.items():
+            st.error(f"Failed to load {name.replace('_', ' ')}: {error}")
+        fellows = enrich(loaded.get("fellows") or [])
 
     # Show modal if a fellow is selected AND trigger_modal is True
     if st.session_state.modal_fellow_id and st.session_state.trigger_modal:
-        selected_fellow = next((f for f in fellows if f["id"] == st.session_state.modal_fellow_id), None)
+        # Cards only carry the card fields; load the full record for the modal
+        selected_fellow = fetch_fellow(st.session_state.modal_fellow_id)
         if selected_fellow:
+            enrich([selected_fellow])
             show_fellow_modal(selected_fellow)
         # Reset trigger after showing modal
         st.session_state.trigger_modal = False
@@ -510,12 +541,12 @@ def main():
             show_fellow_form()
         return
 
+    # Columns/indexes for filtering and sorting, rebuilt only when fellows are refetched
+    roster = cached_derived(AIRTABLE_TABLE_NAME, "fellow_roster", (fellows,), fellow_roster)
+
     # Calculate stats
-    total = len(fellows)
-    on_track = len([f for f in fellows if f["status"] in ["on-track", "Active"]])
-    flagged = len([f for f in fellows if f["status"] in ["flagged", "Flagged"]])
-    ending_soon = len([f for f in fellows if f["status"] in ["ending-soon", "Ending Soon"]])
-    needs_checkin = len([f for f in fellows if calculate_days_since(f["last_check_in"]) > 210 and f["status"] in ["on-track", "Active"] and "AI Security" not in (f.get("fellow_type") or "")])
+    stats = roster.stats()
+    total = stats["total"]
 
     # Stats row
     st.markdown("---")
@@ -524,92 +555,80 @@ def main():
     with col1:
         st.metric("Total Fellows", total, help="Currently placed")
     with col2:
-        st.metric("Active", on_track, help="No issues")
+        st.metric("Active", stats["on_track"], help="No issues")
     with col3:
-        st.metric("Needs Check-in", needs_checkin, help="7+ months since contact")
+        st.metric("Needs Check-in", stats["needs_checkin"], help="7+ months since contact")
     with col4:
-        st.metric("Flagged", flagged, help="Needs attention")
+        st.metric("Flagged", stats["flagged"], help="Needs attention")
     with col5:
-        st.metric("Ending Soon", ending_soon, help="Within 90 days")
+        st.metric("Ending Soon", stats["ending_soon"], help="Within 90 days")
+
+    # Monthly report compliance across the whole roster
+    compliance = load_report_compliance(fellows)
+    if compliance is None:
+        st.caption("Monthly report counts are unavailable until status reports load.")
+    else:
+        report_stats = compliance_stats(compliance)
+        col1, col2, col3, col4, _ = st.columns(5)
+
+        with col1:
+            st.metric("Reporting", report_stats["reporting"], help="Fellows with monthly status reports")
+        with col2:
+            st.metric("Gift Card Eligible", report_stats["gift_card_eligible"], help="3+ months submitted in a row")
+        with col3:
+            st.metric("At Risk", report_stats["at_risk"], help="Missed 1 month")
+        with col4:
+            st.metric("Reimbursements Paused", report_stats["reimbursements_paused"], help="Missed 2+ months in a row")
 
     st.markdown("---")
 
     # Filters
+    # Current filter values come from the widgets' session state, so each
+    # selectbox can show its option counts under the other active filters
+    filters = {name: selection(st.session_state.get(key)) for name, key in FILTER_KEYS.items()}
+    search = st.session_state.get("fellow_search", "")
+    report_filter = st.session_state.get("fellow_report_filter")
+    if compliance is None or not selection(report_filter):
+        report_ids = None
+    else:
+        report_ids = fellows_matching(compliance, report_filter)
+    counts = roster.facet_counts(search=search, ids=report_ids, **filters)
+
     with st.expander("Filters", expanded=True):
         col1, col2, col3, col4, col5 = st.columns(5)
 
         with col1:
-            search = st.text_input("Search", placeholder="Name or office...")
+            st.text_input("Search", placeholder="Name, office, background...", key="fellow_search")
         with col2:
             status_options = ["All Statuses", "Active", "Flagged", "Ending Soon"]
-            status_filter = st.selectbox("Status", status_options)
+            st.selectbox("Status", status_options, key=FILTER_KEYS["status"],
+                         format_func=option_label(counts["status"]))
         with col3:
             fellow_type_options = ["All Types", "Senior Congressional Innovation Fellow", "Congressional Innovation Fellow", "AI Security Fellow"]
-            fellow_type_filter = st.selectbox("Fellow Type", fellow_type_options)
+            st.selectbox("Fellow Type", fellow_type_options, key=FILTER_KEYS["fellow_type"],
+                         format_func=option_label(counts["fellow_type"]))
         with col4:
             party_options = ["All Parties", "Democrat", "Republican", "Independent"]
-            party_filter = st.selectbox("Party", party_options)
+            st.selectbox("Party", party_options, key=FILTER_KEYS["party"],
+                         format_func=option_label(counts["party"]))
         with col5:
             chamber_options = ["All Chambers", "Senate", "House"]
-            chamber_filter = st.selectbox("Chamber", chamber_options)
+            st.selectbox("Chamber", chamber_options, key=FILTER_KEYS["chamber"],
+                         format_func=option_label(counts["chamber"]))
 
-        # Cohort filter
-        col1, col2 = st.columns(2)
+        # Cohort, report status and sort
+        col1, col2, col3 = st.columns(3)
         with col1:
-            cohorts = sorted(set([f["cohort"] for f in fellows if f["cohort"]]), reverse=True)
-            cohort_options = ["All Cohorts"] + cohorts
-            cohort_filter = st.selectbox("Cohort", cohort_options)
+            st.selectbox("Cohort", ["All Cohorts"] + roster.cohorts(), key=FILTER_KEYS["cohort"],
+                         format_func=option_label(counts["cohort"]))
         with col2:
-            sort_options = ["Priority (Flagged first)", "Name (A-Z)", "Name (Z-A)", "Last Check-in (oldest first)", "Last Check-in (newest first)", "End Date (soonest first)", "End Date (latest first)", "Cohort (newest first)", "Cohort (oldest first)"]
-            sort_by = st.selectbox("Sort by", sort_options, index=sort_options.index("Cohort (newest first)"))
-
-    # Apply filters
-    filtered_fellows = fellows.copy()
-
-    if search:
-        search_lower = search.lower()
-        filtered_fellows = [f for f in filtered_fellows if
-            search_lower in f["name"].lower() or
-            search_lower in f["office"].lower()]
-
-    if status_filter != "All Statuses":
-        filtered_fellows = [f for f in filtered_fellows if f["status"] == status_filter]
-
-    if fellow_type_filter != "All Types":
-        filtered_fellows = [f for f in filtered_fellows if f["fellow_type"] == fellow_type_filter]
-
-    if party_filter != "All Parties":
-        filtered_fellows = [f for f in filtered_fellows if f["party"] == party_filter]
-
-    if chamber_filter != "All Chambers":
-        filtered_fellows = [f for f in filtered_fellows if f["chamber"] == chamber_filter]
-
-    if cohort_filter != "All Cohorts":
-        filtered_fellows = [f for f in filtered_fellows if f["cohort"] == cohort_filter]
-
-    # Sort based on selected option
-    if sort_by == "Priority (Flagged first)":
-        def sort_key(f):
-            status_priority = {"flagged": 0, "Flagged": 0, "ending-soon": 1, "Ending Soon": 1, "on-track": 2, "Active": 2}.get(f["status"], 3)
-            days_since = calculate_days_since(f["last_check_in"])
-            return (status_priority, -days_since)
-        filtered_fellows.sort(key=sort_key)
-    elif sort_by == "Name (A-Z)":
-        filtered_fellows.sort(key=lambda f: f["name"].lower())
-    elif sort_by == "Name (Z-A)":
-        filtered_fellows.sort(key=lambda f: f["name"].lower(), reverse=True)
-    elif sort_by == "Last Check-in (oldest first)":
-        filtered_fellows.sort(key=lambda f: f["last_check_in"] or "0000-00-00")
-    elif sort_by == "Last Check-in (newest first)":
-        filtered_fellows.sort(key=lambda f: f["last_check_in"] or "0000-00-00", reverse=True)
-    elif sort_by == "End Date (soonest first)":
-        filtered_fellows.sort(key=lambda f: f["end_date"] or "9999-99-99")
-    elif sort_by == "End Date (latest first)":
-        filtered_fellows.sort(key=lambda f: f["end_date"] or "0000-00-00", reverse=True)
-    elif sort_by == "Cohort (newest first)":
-        filtered_fellows.sort(key=lambda f: f["cohort"] or "", reverse=True)
-    elif sort_by == "Cohort (oldest first)":
-        filtered_fellows.sort(key=lambda f: f["cohort"] or "")
+            st.selectbox("Reports", ["All Report Statuses"] + list(REPORT_FILTERS), key="fellow_report_filter",
+                         disabled=compliance is None)
+        with col3:
+            sort_by = st.selectbox("Sort by", FELLOW_SORT_OPTIONS, index=FELLOW_SORT_OPTIONS.index(FELLOW_DEFAULT_SORT))
+
+    # Apply filters and sort
+    filtered_fellows = roster.query(sort_by, search=search, ids=report_ids, **filters)
 
     # Show count
     st.caption(f"Showing {len(filtered_fellows)} of {total} fellows")
@@ -618,18 +637,18 @@ def main():
     if st.session_state.show_add_form or st.session_state.editing_fellow:
         show_fellow_form()
 
-    # Display fellows in cards
-    cols = st.columns(3)
-    for idx, fellow in enumerate(filtered_fellows):
-        with cols[idx % 3]:
-            show_fellow_card(fellow)
+    # Display fellows in cards, a page at a time
+    view = (search, tuple(filters.items()), report_filter, sort_by)
+    action = show_card_grid(filtered_fellows, fellow_card_html, "fellow_grid", view)
+    if action:
+        handle_card_action(action)
 
 
-def show_fellow_card(fellow):
-    """Display a fellow card (collapsed view only - modal handles expanded view)"""
-    days_since_checkin = calculate_days_since(fellow["last_check_in"])
-    is_aisf = "AI Security" in (fellow.get("fellow_type") or "")
-    needs_checkin = days_since_checkin > 210 and fellow["status"] in ["on-track", "Active"] and not is_aisf
+def fellow_card_html(fellow):
+    """HTML for a fellow card (collapsed view only - modal handles expanded view)"""
+    days_since_checkin = fellow.days_since_checkin
+    is_aisf = fellow.is_aisf
+    needs_checkin = fellow.needs_checkin
 
     # Status badge colors
     status_colors = {
@@ -640,7 +659,7 @@ def show_fellow_card(fellow):
         "ending-soon": ("#f87171", "#991b1b"),
         "Ending Soon": ("#f87171", "#991b1b")
     }
-    status_label = {"on-track": "Active", "flagged": "Flagged", "ending-soon": "Ending Soon"}.get(fellow["status"], fellow["status"])
+    status_label = fellow.status_label
     bg_color, text_color = status_colors.get(fellow["status"], ("#4ade80", "#166534"))
 
     # Fellow type badge
@@ -684,7 +703,7 @@ def show_fellow_card(fellow):
     # CARD VIEW
     office_html = ""
     if fellow["office"]:
-        office_html = f'<div style="color:#374151;font-size:0.875rem;margin-bottom:0.25rem;">{fellow["office"]}</div>'
+        office_html = f'<div style="color:#374151;font-size:0.875rem;margin-bottom:0.25rem;">{escape(fellow["office"])}</div>'
 
     term_html = ""
     if fellow["start_date"] and fellow["end_date"]:
@@ -694,30 +713,37 @@ def show_fellow_card(fellow):
     if fellow["last_check_in"]:
         checkin_html = f'<div style="color:#6b7280;font-size:0.8rem;">Last check-in: {fellow["last_check_in"]}</div>'
 
-    card_html = f'<div style="background-color:white;padding:1.25rem;border-radius:0.75rem;border:1px solid #e5e7eb;margin-bottom:1rem;box-shadow:0 1px 3px rgba(0,0,0,0.1);"><div style="font-weight:600;font-size:1.1rem;margin-bottom:0.25rem;color:#1f2937;">{fellow["name"]}</div><div style="color:#6b7280;font-size:0.875rem;margin-bottom:0.75rem;">Cohort: {fellow["cohort"]}</div><div style="margin-bottom:0.5rem;"><span style="display:inline-block;padding:0.25rem 0.75rem;border-radius:9999px;font-size:0.75rem;font-weight:500;background-color:{bg_color};color:{text_color};">{status_label}</span>{checkin_badge}</div><div style="margin-bottom:0.5rem;">{type_html}{party_html}</div>{office_html}{term_html}{checkin_html}</div>'
+    card_html = f'<div style="background-color:white;padding:1.25rem;border-radius:0.75rem;border:1px solid #e5e7eb;margin-bottom:1rem;box-shadow:0 1px 3px rgba(0,0,0,0.1);"><div style="font-weight:600;font-size:1.1rem;margin-bottom:0.25rem;color:#1f2937;">{escape(fellow["name"])}</div><div style="color:#6b7280;font-size:0.875rem;margin-bottom:0.75rem;">Cohort: {escape(fellow["cohort"])}</div><div style="margin-bottom:0.5rem;"><span style="display:inline-block;padding:0.25rem 0.75rem;border-radius:9999px;font-size:0.75rem;font-weight:500;background-color:{bg_color};color:{text_color};">{escape(status_label)}</span>{checkin_badge}</div><div style="margin-bottom:0.5rem;">{type_html}{party_html}</div>{office_html}{term_html}{checkin_html}</div>'
 
-    st.markdown(card_html, unsafe_allow_html=True)
+    return card_html
 
-    # Action buttons
-    col1, col2 = st.columns(2)
-    with col1:
-        if st.button("View", key=f"view_{fellow['id']}", use_container_width=True):
-            st.session_state.modal_fellow_id = fellow["id"]
-            st.session_state.trigger_modal = True
-            st.rerun()
-    with col2:
-        if st.button("Edit", key=f"edit_{fellow['id']}", use_container_width=True):
-            st.session_state.editing_fellow = fellow
-            st.session_state.show_add_form = False
-            st.rerun()
+
+def handle_card_action(action):
+    """Open the modal or edit form for a View/Edit click in the card grid"""
+    if action["action"] == "view":
+        st.session_state.modal_fellow_id = action["id"]
+        st.session_state.trigger_modal = True
+    elif action["action"] == "edit":
+        st.session_state.editing_fellow = fetch_fellow(action["id"])
+        st.session_state.show_add_form = False
+    st.rerun()
 
 
 @st.dialog("Fellow Details", width="large")
 def show_fellow_modal(fellow):
     """Display fellow details in a modal dialog"""
-    days_since_checkin = calculate_days_since(fellow["last_check_in"])
-    is_aisf = "AI Security" in (fellow.get("fellow_type") or "")
-    needs_checkin = days_since_checkin > 210 and fellow["status"] in ["on-track", "Active"] and not is_aisf
+    # Warm the read cache for both sections in parallel, so the fragments
+    # below find their data already loaded
+    tasks = {"checkins": (fetch_checkins, fellow["id"], fellow["name"])}
+    if fellow.get("requires_monthly_reports"):
+        tasks["status_reports"] = (fetch_status_reports, fellow["id"], fellow["name"])
+    _, load_errors = load_concurrently(tasks, timeout=MODAL_LOAD_TIMEOUT)
+    for name, error in load_errors.items():
+        st.warning(f"Couldn't load {name.replace('_', ' ')}: {error}")
+
+    days_since_checkin = fellow.days_since_checkin
+    is_aisf = fellow.is_aisf
+    needs_checkin = fellow.needs_checkin
 
     # Status badge colors
     status_colors = {
@@ -728,7 +754,7 @@ def show_fellow_modal(fellow):
         "ending-soon": ("#f87171", "#991b1b"),
         "Ending Soon": ("#f87171", "#991b1b")
     }
-    status_label = {"on-track": "Active", "flagged": "Flagged", "ending-soon": "Ending Soon"}.get(fellow["status"], fellow["status"])
+    status_label = fellow.status_label
     bg_color, text_color = status_colors.get(fellow["status"], ("#4ade80", "#166534"))
 
     # Fellow type badge
@@ -824,103 +850,125 @@ def show_fellow_modal(fellow):
         st.markdown("#### Notes")
         st.markdown(fellow["notes"])
 
-    # Monthly Status Reports (only if required)
+    # Reports and check-ins are fragments: their buttons and forms rerun only
+    # their own section, reloading just this fellow's rows
     if fellow.get("requires_monthly_reports"):
         st.markdown("---")
-        st.markdown("#### Monthly Status Reports")
-
-        # Link to Google Sheet
-        st.markdown(f"[📊 View All Responses in Google Sheet]({GOOGLE_SHEET_URL})")
-
-        # Get required months and submitted reports
-        required_months = get_required_report_months(fellow)
-        status_reports = fetch_status_reports(fellow["id"])
-        streak_info = calculate_report_streak(status_reports, required_months)
-
-        # Status badges
-        report_badges_html = ""
-        if streak_info["streak"] > 0:
-            report_badges_html += f'<span style="display:inline-block;padding:0.25rem 0.75rem;border-radius:9999px;font-size:0.75rem;font-weight:500;background-color:#f97316;color:#ffffff;margin-right:0.5rem;">🔥 Streak: {streak_info["streak"]}</span>'
-        if streak_info["gift_card_eligible"]:
-            report_badges_html += '<span style="display:inline-block;padding:0.25rem 0.75rem;border-radius:9999px;font-size:0.75rem;font-weight:500;background-color:#22c55e;color:#ffffff;margin-right:0.5rem;">🎁 Gift Card Earned!</span>'
-        if streak_info["at_risk"]:
-            report_badges_html += '<span style="display:inline-block;padding:0.25rem 0.75rem;border-radius:9999px;font-size:0.75rem;font-weight:500;background-color:#eab308;color:#ffffff;margin-right:0.5rem;">⚠️ At Risk</span>'
-        if streak_info["reimbursements_paused"]:
-            report_badges_html += '<span style="display:inline-block;padding:0.25rem 0.75rem;border-radius:9999px;font-size:0.75rem;font-weight:500;background-color:#ef4444;color:#ffffff;margin-right:0.5rem;">🚫 Reimbursements Paused</span>'
-
-        if report_badges_html:
-            st.markdown(f'<div style="margin-bottom:1rem;">{report_badges_html}</div>', unsafe_allow_html=True)
-
-        # Get submitted months
-        submitted_months = {r["month"]: r for r in status_reports if r.get("submitted")}
-
-        # Display each required month
-        today = datetime.now()
-        for month in required_months:
-            try:
-                month_date = datetime.strptime(month, "%b %Y")
-                # Get last day of month for due date
-                if month_date.month == 12:
-                    last_day = datetime(month_date.year + 1, 1, 1) - timedelta(days=1)
-                else:
-                    last_day = datetime(month_date.year, month_date.month + 1, 1) - timedelta(days=1)
-            except:
-                continue
-
-            is_submitted = month in submitted_months
-            is_overdue = not is_submitted and last_day < today
-
-            if is_submitted:
-                report = submitted_months[month]
-                st.markdown(f'<div style="background-color:#dcfce7;padding:0.5rem 0.75rem;border-radius:0.5rem;margin-bottom:0.5rem;border-left:3px solid #22c55e;"><span style="color:#166534;font-weight:600;">✅ {month}</span> — Submitted {report.get("date_submitted", "")}</div>', unsafe_allow_html=True)
-            elif is_overdue:
-                st.markdown(f'<div style="background-color:#fee2e2;padding:0.5rem 0.75rem;border-radius:0.5rem;margin-bottom:0.5rem;border-left:3px solid #ef4444;"><span style="color:#991b1b;font-weight:600;">❌ {month}</span> — OVERDUE (was due {last_day.strftime("%b %d")})</div>', unsafe_allow_html=True)
-            else:
-                st.markdown(f'<div style="background-color:#f8fafc;padding:0.5rem 0.75rem;border-radius:0.5rem;margin-bottom:0.5rem;border-left:3px solid #94a3b8;"><span style="color:#475569;font-weight:600;">⬜ {month}</span> — Due {last_day.strftime("%b %d")}</div>', unsafe_allow_html=True)
-
-        # Mark as submitted button
-        st.markdown("##### Mark Report as Submitted")
-        with st.form(f"status_report_form_{fellow['id']}"):
-            month_to_mark = st.selectbox("Month", required_months)
-            date_submitted = st.date_input("Date Submitted", value=datetime.now())
-
-            if st.form_submit_button("Mark Submitted", use_container_width=True):
-                # Check if report already exists for this month
-                existing_report = None
-                for r in status_reports:
-                    if r.get("month") == month_to_mark:
-                        existing_report = r
-                        break
-
-                if existing_report:
-                    # Update existing
-                    if update_status_report(existing_report["id"], True, date_submitted.strftime("%Y-%m-%d")):
-                        st.success(f"Marked {month_to_mark} as submitted!")
-                        import time
-                        time.sleep(1)
-                        st.rerun()
-                else:
-                    # Create new
-                    report_data = {
-                        "fellow_id": fellow["id"],
-                        "month": month_to_mark,
-                        "submitted": True,
-                        "date_submitted": date_submitted.strftime("%Y-%m-%d")
-                    }
-                    if add_status_report(report_data):
-                        st.success(f"Marked {month_to_mark} as submitted!")
-                        import time
-                        time.sleep(1)
-                        st.rerun()
+        show_status_reports_section(fellow)
+
+    st.markdown("---")
+    show_checkins_section(fellow)
 
     st.markdown("---")
 
-    # Check-in History
+    # Action buttons at bottom
+    btn_col1, btn_col2 = st.columns(2)
+    with btn_col1:
+        if st.button("Edit Fellow", key=f"edit_modal_{fellow['id']}", use_container_width=True, type="primary"):
+            st.session_state.editing_fellow = fellow
+            st.session_state.modal_fellow_id = None
+            st.rerun()
+    with btn_col2:
+        if st.button("Close", key=f"close_modal_{fellow['id']}", use_container_width=True):
+            st.session_state.modal_fellow_id = None
+            st.rerun()
+
+
+@st.fragment
+def show_status_reports_section(fellow):
+    """Monthly status reports for one fellow, with the form to mark months submitted"""
+    show_flash_messages()
+
+    st.markdown("#### Monthly Status Reports")
+
+    # Link to Google Sheet
+    st.markdown(f"[📊 View All Responses in Google Sheet]({GOOGLE_SHEET_URL})")
+
+    # Get required months and submitted reports
+    required_months = get_required_report_months(fellow)
+    status_reports = fetch_status_reports(fellow["id"], fellow["name"])
+    if status_reports is None:
+        st.error("Failed to load status reports")
+        return
+    streak_info = calculate_report_streak(status_reports, required_months)
+
+    # Status badges
+    report_badges_html = ""
+    if streak_info["streak"] > 0:
+        report_badges_html += f'<span style="display:inline-block;padding:0.25rem 0.75rem;border-radius:9999px;font-size:0.75rem;font-weight:500;background-color:#f97316;color:#ffffff;margin-right:0.5rem;">🔥 Streak: {streak_info["streak"]}</span>'
+    if streak_info["gift_card_eligible"]:
+        report_badges_html += '<span style="display:inline-block;padding:0.25rem 0.75rem;border-radius:9999px;font-size:0.75rem;font-weight:500;background-color:#22c55e;color:#ffffff;margin-right:0.5rem;">🎁 Gift Card Earned!</span>'
+    if streak_info["at_risk"]:
+        report_badges_html += '<span style="display:inline-block;padding:0.25rem 0.75rem;border-radius:9999px;font-size:0.75rem;font-weight:500;background-color:#eab308;color:#ffffff;margin-right:0.5rem;">⚠️ At Risk</span>'
+    if streak_info["reimbursements_paused"]:
+        report_badges_html += '<span style="display:inline-block;padding:0.25rem 0.75rem;border-radius:9999px;font-size:0.75rem;font-weight:500;background-color:#ef4444;color:#ffffff;margin-right:0.5rem;">🚫 Reimbursements Paused</span>'
+
+    if report_badges_html:
+        st.markdown(f'<div style="margin-bottom:1rem;">{report_badges_html}</div>', unsafe_allow_html=True)
+
+    # Get submitted months
+    submitted_months = {r["month"]: r for r in status_reports if r.get("submitted")}
+
+    # Display each required month
+    today_ord = date.today().toordinal()
+    for month in required_months:
+        month_ord = parse_month(month)
+        if month_ord is None:
+            continue
+        # Due on the last day of the month
+        last_day = date.fromordinal(due_date(month_ord))
+
+        is_submitted = month in submitted_months
+        is_overdue = not is_submitted and is_past_due(month_ord, today_ord)
+
+        if is_submitted:
+            report = submitted_months[month]
+            st.markdown(f'<div style="background-color:#dcfce7;padding:0.5rem 0.75rem;border-radius:0.5rem;margin-bottom:0.5rem;border-left:3px solid #22c55e;"><span style="color:#166534;font-weight:600;">✅ {month}</span> — Submitted {report.get("date_submitted", "")}</div>', unsafe_allow_html=True)
+        elif is_overdue:
+            st.markdown(f'<div style="background-color:#fee2e2;padding:0.5rem 0.75rem;border-radius:0.5rem;margin-bottom:0.5rem;border-left:3px solid #ef4444;"><span style="color:#991b1b;font-weight:600;">❌ {month}</span> — OVERDUE (was due {last_day.strftime("%b %d")})</div>', unsafe_allow_html=True)
+        else:
+            st.markdown(f'<div style="background-color:#f8fafc;padding:0.5rem 0.75rem;border-radius:0.5rem;margin-bottom:0.5rem;border-left:3px solid #94a3b8;"><span style="color:#475569;font-weight:600;">⬜ {month}</span> — Due {last_day.strftime("%b %d")}</div>', unsafe_allow_html=True)
+
+    # Mark as submitted button
+    st.markdown("##### Mark Reports as Submitted")
+    with st.form(f"status_report_form_{fellow['id']}"):
+        months_to_mark = st.multiselect("Month(s)", required_months)
+        date_submitted = st.date_input("Date Submitted", value=datetime.now())
+
+        if st.form_submit_button("Mark Submitted", use_container_width=True):
+            if not months_to_mark:
+                st.warning("Select at least one month")
+            else:
+                # Update reports that already exist for a month, create the rest
+                existing_reports = {r.get("month"): r for r in status_reports}
+                date_str = date_submitted.strftime("%Y-%m-%d")
+                to_update = [existing_reports[m]["id"] for m in months_to_mark if m in existing_reports]
+                to_create = [
+                    {"fellow_id": fellow["id"], "month": m, "submitted": True, "date_submitted": date_str}
+                    for m in months_to_mark if m not in existing_reports
+                ]
+
+                results = []
+                if to_update:
+                    results += update_status_reports(to_update, True, date_str)
+                if to_create:
+                    results += add_status_reports(to_create)
+
+                if all(r["success"] for r in results):
+                    flash(f"Marked {', '.join(months_to_mark)} as submitted!")
+                    st.rerun(scope="fragment")
+
+
+@st.fragment
+def show_checkins_section(fellow):
+    """Check-in history for one fellow, with the log and delete actions"""
+    show_flash_messages()
+
     st.markdown("#### Check-in History")
 
     if st.button("+ Log Check-in", key=f"log_checkin_{fellow['id']}", use_container_width=True):
         st.session_state.show_checkin_form = True
-        st.rerun()
+        st.rerun(scope="fragment")
 
     # Show check-in form if toggled
     if st.session_state.show_checkin_form:
@@ -942,20 +990,18 @@ def show_fellow_modal(fellow):
                     }
                     if add_checkin(checkin_data):
                         if update_fellow_checkin(fellow["id"], checkin_date.strftime("%Y-%m-%d")):
-                            st.success("Check-in logged!")
+                            flash("Check-in logged!")
                         else:
-                            st.warning("Check-in logged but failed to update Last Check-in date")
+                            flash("Check-in logged but failed to update Last Check-in date", "warning")
                         st.session_state.show_checkin_form = False
-                        import time
-                        time.sleep(2)
-                        st.rerun()
+                        st.rerun(scope="fragment")
             with form_col2:
                 if st.form_submit_button("Cancel", use_container_width=True):
                     st.session_state.show_checkin_form = False
-                    st.rerun()
+                    st.rerun(scope="fragment")
 
     # Display check-in history
-    checkins = fetch_checkins(fellow["id"])
+    checkins = fetch_checkins(fellow["id"], fellow["name"])
     if checkins:
         for checkin in checkins:
             st.markdown(f"""
@@ -967,28 +1013,12 @@ def show_fellow_modal(fellow):
             """, unsafe_allow_html=True)
             if st.button("Delete", key=f"delete_checkin_{checkin['id']}", use_container_width=True):
                 if delete_checkin(checkin["id"]):
-                    st.success("Check-in deleted!")
-                    import time
-                    time.sleep(1)
-                    st.rerun()
+                    flash("Check-in deleted!")
+                    st.rerun(scope="fragment")
             st.markdown("<div style='margin-bottom:1rem;'></div>", unsafe_allow_html=True)
     else:
         st.caption("No check-ins recorded yet.")
 
-    st.markdown("---")
-
-    # Action buttons at bottom
-    btn_col1, btn_col2 = st.columns(2)
-    with btn_col1:
-        if st.button("Edit Fellow", key=f"edit_modal_{fellow['id']}", use_container_width=True, type="primary"):
-            st.session_state.editing_fellow = fellow
-            st.session_state.modal_fellow_id = None
-            st.rerun()
-    with btn_col2:
-        if st.button("Close", key=f"close_modal_{fellow['id']}", use_container_width=True):
-            st.session_state.modal_fellow_id = None
-            st.rerun()
-
 
 def show_fellow_form():
     """Show add/edit fellow form"""
@@ -1097,7 +1127,7 @@ def show_fellow_form():
                 if is_editing:
                     success = update_fellow(fellow["id"], fellow_data)
                     if success:
-                        st.success("Fellow updated successfully!")
+                        flash("Fellow updated successfully!")
                         st.session_state.editing_fellow = None
                         st.rerun()
                     else:
@@ -1105,7 +1135,7 @@ def show_fellow_form():
                 else:
                     success = create_fellow(fellow_data)
                     if success:
-                        st.success("Fellow added successfully!")
+                        flash("Fellow added successfully!")
                         st.session_state.show_add_form = False
                         st.rerun()
                     else:
@@ -0,0 +1,285 @@
+import json
+import sys
+from datetime import date
+
+# ============ SCHEMA ============
+
+class Field:
+    """One Airtable field and the record attribute it maps to.
+
+    kind is one of:
+      text     - plain string
+      category - string from a small set (single select, cohort); interned
+      date     - "YYYY-MM-DD"; stored as a date ordinal in `<attr>_ord`
+      multi    - multi-select; tuple of interned strings
+      link     - linked records; tuple of record IDs
+      bool     - checkbox
+    """
+
+    __slots__ = ("attr", "airtable", "kind", "default", "keep_empty", "alias", "slot")
+
+    def __init__(self, attr, airtable, kind="text", default="", keep_empty=False, alias=None):
+        self.attr = attr
+        self.airtable = airtable
+        self.kind = kind
+        self.default = default
+        self.keep_empty = keep_empty  # write the field even when empty
+        self.alias = alias            # form key holding a single linked ID (links only)
+        self.slot = attr + "_ord" if kind == "date" else attr
+
+    def decode(self, fields):
+        """Slot value for this field from an Airtable record's fields"""
+        if self.kind == "date":
+            return date_ordinal(fields.get(self.airtable))
+        if self.kind == "category":
+            value = fields.get(self.airtable)
+            if isinstance(value, str):
+                return sys.intern(value)
+            return self.default if value is None else value
+        if self.kind == "multi":
+            value = fields.get(self.airtable)
+            return tuple(map(sys.intern, value)) if value else ()
+        if self.kind == "link":
+            value = fields.get(self.airtable)
+            return tuple(value) if value else ()
+        return fields.get(self.airtable, self.default)
+
+    def encode(self, data):
+        """Value to send to Airtable for form data or a record"""
+        value = data.get(self.attr, self.default)
+        if self.kind == "link" and not value and self.alias:
+            value = [data.get(self.alias)]
+        if isinstance(value, tuple):
+            value = list(value)
+        return value
+
+
+def date_ordinal(value):
+    """"YYYY-MM-DD" -> date ordinal, 0 when missing or unparseable"""
+    if not value:
+        return 0
+    try:
+        return date.fromisoformat(value[:10]).toordinal()
+    except (TypeError, ValueError):
+        return 0
+
+
+def ordinal_date(ordinal):
+    """Date ordinal -> "YYYY-MM-DD", "" for 0"""
+    return date.fromordinal(ordinal).isoformat() if ordinal else ""
+
+
+def days_since(ordinal, today_ord):
+    """Days from a date ordinal to today, 999 when missing (like calculate_days_since)"""
+    return today_ord - ordinal if ordinal else 999
+
+
+def days_until(ordinal, today_ord):
+    """Whole days left before a date ordinal, 999 when missing (like calculate_days_until)"""
+    # calculate_days_until measures from the current time, not midnight,
+    # so the partial current day is never counted
+    return ordinal - today_ord - 1 if ordinal else 999
+
+
+def slots_for(schema):
+    return tuple(field.slot for field in schema)
+
+
+def date_property(slot):
+    return property(lambda self: ordinal_date(getattr(self, slot)))
+
+
+# ============ RECORD BASE ============
+
+class Record:
+    """Compact view of one Airtable record.
+
+    Subclasses list their fields in SCHEMA; the same schema decodes Airtable
+    records (from_record) and encodes form data for writes (to_fields).
+    Dates are held as ordinals in `<attr>_ord`, with `<attr>` giving the
+    "YYYY-MM-DD" string. Records also support r["attr"] and r.get("attr") so
+    page code written against the old dict records keeps working; hot paths
+    should use plain attributes. Cached records are shared between sessions,
+    so treat them as read-only.
+    """
+
+    __slots__ = ("id", "derived_on")
+    SCHEMA = ()
+    KEEP_FALSE = False  # write False booleans instead of dropping them
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for field in cls.SCHEMA:
+            if field.kind == "date":
+                setattr(cls, field.attr, date_property(field.slot))
+
+    @classmethod
+    def from_record(cls, record):
+        """Decode an Airtable {"id", "fields"} record"""
+        fields = record.get("fields", {})
+        obj = cls.__new__(cls)
+        obj.id = record["id"]
+        obj.derived_on = 0
+        for field in cls.SCHEMA:
+            setattr(obj, field.slot, field.decode(fields))
+        return obj
+
+    @classmethod
+    def to_fields(cls, data):
+        """Encode form data (a dict or record) as Airtable fields, dropping empty values"""
+        fields = {}
+        for field in cls.SCHEMA:
+            value = field.encode(data)
+            if value or field.keep_empty or (cls.KEEP_FALSE and value is False):
+                fields[field.airtable] = value
+        return fields
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def __contains__(self, key):
+        return hasattr(self, key)
+
+    def derive(self, today_ord):
+        """Compute fields that depend on today's date (see enrich)"""
+        self.derived_on = today_ord
+
+    def content_hash(self):
+        """Hash of the record's field values; changes whenever the Airtable record does"""
+        values = tuple(getattr(self, field.slot) for field in self.SCHEMA)
+        try:
+            return hash(values)
+        except TypeError:
+            # Text fields keep whatever Airtable sent, e.g. a list from a lookup field
+            return hash(tuple(
+                json.dumps(value, sort_keys=True, default=repr) if isinstance(value, (list, dict)) else value
+                for value in values
+            ))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.id!r})"
+
+
+def enrich(records, today=None):
+    """Fill in each record's day-dependent fields, at most once per record per day.
+
+    Call right after fetching; cards, sorts and stats then read the derived
+    attributes instead of re-parsing dates on every rerun.
+    """
+    today_ord = (today or date.today()).toordinal()
+    for record in records:
+        if record.derived_on != today_ord:
+            record.derive(today_ord)
+    return records
+
+
+# ============ RECORD TYPES ============
+
+STATUS_LABELS = {"on-track": "Active", "flagged": "Flagged", "ending-soon": "Ending Soon"}
+NEEDS_CHECKIN_DAYS = 210  # 7 months without contact
+
+FELLOW_SCHEMA = (
+    Field("name", "Name"),
+    Field("email", "Email"),
+    Field("phone", "Phone Number"),
+    Field("fellow_type", "Fellow Type", "category"),
+    Field("party", "Party", "category"),
+    Field("office", "Office"),
+    Field("chamber", "Chamber", "category"),
+    Field("linkedin", "LinkedIn"),
+    Field("start_date", "Start Date", "date"),
+    Field("end_date", "End Date", "date"),
+    Field("cohort", "Cohort", "category"),
+    Field("status", "Status", "category", default="Active"),
+    Field("last_check_in", "Last Check-in", "date"),
+    Field("prior_role", "Prior Role"),
+    Field("education", "Education"),
+    Field("notes", "Notes"),
+    Field("requires_monthly_reports", "Requires Monthly Reports", "bool", default=False),
+    Field("report_start_date", "Report Start Date", "date"),
+    Field("report_end_month", "Report End Month", "category")
+)
+
+
+class Fellow(Record):
+    __slots__ = slots_for(FELLOW_SCHEMA) + (
+        "days_since_checkin", "days_until_end", "is_aisf", "status_label", "needs_checkin"
+    )
+    SCHEMA = FELLOW_SCHEMA
+
+    def derive(self, today_ord):
+        self.derived_on = today_ord
+        self.days_since_checkin = days_since(self.last_check_in_ord, today_ord)
+        self.days_until_end = days_until(self.end_date_ord, today_ord)
+        self.is_aisf = "AI Security" in (self.fellow_type or "")
+        # Older records use the lowercase slugs; normalize to the display labels
+        self.status_label = STATUS_LABELS.get(self.status, self.status)
+        self.needs_checkin = (
+            self.days_since_checkin > NEEDS_CHECKIN_DAYS and self.status_label == "Active" and not self.is_aisf
+        )
+
+
+ALUMNI_SCHEMA = (
+    Field("name", "Name"),
+    Field("email", "Email"),
+    Field("phone", "Phone Number"),
+    Field("cohort", "Cohort", "category"),
+    Field("fellow_types", "Fellow Type", "multi", default=(), keep_empty=True),
+    Field("office_served", "Office Served"),
+    Field("chamber", "Chamber", "category"),
+    Field("party", "Party", "category"),
+    Field("current_role", "Current Role"),
+    Field("current_org", "Current Organization", "category"),
+    Field("sector", "Sector", "category"),
+    Field("location", "Location", "category"),
+    Field("linkedin", "LinkedIn"),
+    Field("last_engaged", "Last Engaged", "date"),
+    Field("engagement_notes", "Engagement Notes"),
+    Field("notes", "Notes"),
+    Field("prior_role", "Prior Role"),
+    Field("education", "Education")
+)
+
+
+class Alumni(Record):
+    __slots__ = slots_for(ALUMNI_SCHEMA) + ("days_since_engaged",)
+    SCHEMA = ALUMNI_SCHEMA
+
+    def derive(self, today_ord):
+        self.derived_on = today_ord
+        self.days_since_engaged = days_since(self.last_engaged_ord, today_ord)
+
+
+CHECKIN_SCHEMA = (
+    Field("fellow", "Fellow", "link", alias="fellow_id"),
+    Field("date", "Date", "date"),
+    Field("check_in_type", "Check-in Type", "category"),
+    Field("notes", "Notes"),
+    Field("staff_member", "Staff Member", "category")
+)
+
+
+class CheckIn(Record):
+    __slots__ = slots_for(CHECKIN_SCHEMA)
+    SCHEMA = CHECKIN_SCHEMA
+
+
+STATUS_REPORT_SCHEMA = (
+    Field("fellow", "Fellow", "link", alias="fellow_id"),
+    Field("month", "Month", "category"),
+    Field("submitted", "Submitted", "bool", default=False),
+    Field("date_submitted", "Date Submitted", "date"),
+    Field("notes", "Notes")
+)
+
+
+class StatusReport(Record):
+    __slots__ = slots_for(STATUS_REPORT_SCHEMA)
+    SCHEMA = STATUS_REPORT_SCHEMA
+    KEEP_FALSE = True
@@ -0,0 +1,101 @@
+from datetime import date
+from functools import lru_cache
+
+# ============ MONTH ORDINALS ============
+# A report month is one integer, year * 12 + (month - 1), so ranges, ordering
+# and "is this month due yet" are arithmetic instead of strptime/strftime.
+
+MONTH_ABBRS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+MONTH_NUMBERS = {abbr: i for i, abbr in enumerate(MONTH_ABBRS)}
+
+def month_ordinal(year, month):
+    """Ordinal for a calendar month (month is 1-12)"""
+    return year * 12 + month - 1
+
+
+# Without a Report End Month override, reports run through Sep 2026 for
+# fellows and Nov 2026 for senior fellows
+DEFAULT_END_MONTH = month_ordinal(2026, 9)
+SENIOR_END_MONTH = month_ordinal(2026, 11)
+
+
+def date_month(d):
+    """Ordinal of the month containing a date"""
+    return month_ordinal(d.year, d.month)
+
+
+def month_start(month):
+    """The first day of a month ordinal, as a date"""
+    year, index = divmod(month, 12)
+    return date(year, index + 1, 1)
+
+
+@lru_cache(maxsize=None)
+def month_label(month):
+    """"Mon YYYY" label for a month ordinal, as stored in the Status Reports Month field"""
+    year, index = divmod(month, 12)
+    return f"{MONTH_ABBRS[index]} {year}"
+
+
+@lru_cache(maxsize=1024)
+def parse_month(label):
+    """Month ordinal for a "Mon YYYY" label, or None if it isn't one"""
+    try:
+        abbr, year = label.split()
+        return month_ordinal(int(year), MONTH_NUMBERS[abbr] + 1)
+    except (AttributeError, KeyError, ValueError):
+        return None
+
+
+def parse_iso_month(value):
+    """Month ordinal for a "YYYY-MM-DD" date string, or None"""
+    try:
+        return month_ordinal(int(value[0:4]), int(value[5:7]))
+    except (TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=None)
+def due_date(month):
+    """Day ordinal of a month's due date: its last day"""
+    return month_start(month + 1).toordinal() - 1
+
+
+def is_past_due(month, today_ord):
+    """Whether a month's due date has passed (the due day itself counts as passed)"""
+    return due_date(month) <= today_ord
+
+
+def last_past_due_month(today_ord):
+    """Latest month whose due date has passed on a given day"""
+    today_month = date_month(date.fromordinal(today_ord))
+    return today_month if is_past_due(today_month, today_ord) else today_month - 1
+
+
+# ============ REQUIRED MONTHS ============
+
+@lru_cache(maxsize=1024)
+def required_months(start_month, end_month):
+    """Month ordinals from start to end inclusive (memoized per pair)"""
+    return tuple(range(start_month, end_month + 1))
+
+
+@lru_cache(maxsize=1024)
+def required_month_labels(start_month, end_month):
+    return tuple(month_label(m) for m in required_months(start_month, end_month))
+
+
+def report_window(requires_reports, report_start_date, report_end_month="", fellow_type=""):
+    """(start, end) month ordinals a fellow reports for, or None if they don't"""
+    if not requires_reports or not report_start_date:
+        return None
+    start = parse_iso_month(report_start_date)
+    if start is None:
+        return None
+    if report_end_month:
+        end = parse_month(report_end_month)
+        if end is None:
+            return None
+    else:
+        end = SENIOR_END_MONTH if "Senior" in (fellow_type or "") else DEFAULT_END_MONTH
+    return start, end
@@ -0,0 +1,428 @@
+from datetime import date
+
+from facets import FacetIndex, bitmap_rows, rows_bitmap
+from records import NEEDS_CHECKIN_DAYS
+from search_index import ALUMNI_SEARCH_FIELDS, FELLOW_SEARCH_FIELDS, SearchIndex, TrigramIndex
+
+try:
+    import numpy as np
+except ImportError:  # columnar backend disabled, list pipelines still work
+    np = None
+
+# ============ FILTER HELPERS ============
+
+def selection(value):
+    """Selectbox value -> filter value ("All ..." placeholders mean no filter)"""
+    if not value or value.startswith("All "):
+        return None
+    return value
+
+
+def option_label(counts):
+    """format_func for a filter selectbox that shows each option's count, e.g. "Senate (12)".
+
+    `counts` is one facet of FacetIndex.counts; "All ..." options show its None total.
+    """
+    def label(option):
+        return f"{option} ({counts.get(selection(option), 0)})"
+    return label
+
+
+def cohort_options(records):
+    """Distinct cohorts, newest first"""
+    return sorted(set(r.cohort for r in records if r.cohort), reverse=True)
+
+
+# ============ CURRENT FELLOWS ============
+
+FELLOW_SORT_OPTIONS = [
+    "Priority (Flagged first)", "Name (A-Z)", "Name (Z-A)",
+    "Last Check-in (oldest first)", "Last Check-in (newest first)",
+    "End Date (soonest first)", "End Date (latest first)",
+    "Cohort (newest first)", "Cohort (oldest first)"
+]
+FELLOW_DEFAULT_SORT = "Cohort (newest first)"
+
+STATUS_PRIORITY = {"flagged": 0, "Flagged": 0, "ending-soon": 1, "Ending Soon": 1, "on-track": 2, "Active": 2}
+
+# Filter name -> (record attribute, multi-valued?) for the FacetIndex.
+# Status filters on the display label so legacy slugs ("on-track") match too.
+FELLOW_FACETS = {
+    "status": ("status_label", False),
+    "fellow_type": ("fellow_type", False),
+    "party": ("party", False),
+    "chamber": ("chamber", False),
+    "cohort": ("cohort", False)
+}
+
+
+def fellow_stats(fellows):
+    """Counts for the stat cards at the top of the Current Fellows page (fellows must be enriched)"""
+    return {
+        "total": len(fellows),
+        "on_track": len([f for f in fellows if f.status_label == "Active"]),
+        "flagged": len([f for f in fellows if f.status_label == "Flagged"]),
+        "ending_soon": len([f for f in fellows if f.status_label == "Ending Soon"]),
+        "needs_checkin": len([f for f in fellows if f.needs_checkin])
+    }
+
+
+def sort_fellows(fellows, sort_by):
+    """Sort a list of fellows in place by one of FELLOW_SORT_OPTIONS"""
+    # Missing dates are ordinal 0, which sorts as oldest like the old "0000-00-00"
+    if sort_by == "Priority (Flagged first)":
+        fellows.sort(key=lambda f: (STATUS_PRIORITY.get(f.status, 3), -f.days_since_checkin))
+    elif sort_by == "Name (A-Z)":
+        fellows.sort(key=lambda f: f.name.lower())
+    elif sort_by == "Name (Z-A)":
+        fellows.sort(key=lambda f: f.name.lower(), reverse=True)
+    elif sort_by == "Last Check-in (oldest first)":
+        fellows.sort(key=lambda f: f.last_check_in_ord)
+    elif sort_by == "Last Check-in (newest first)":
+        fellows.sort(key=lambda f: f.last_check_in_ord, reverse=True)
+    elif sort_by == "End Date (soonest first)":
+        fellows.sort(key=lambda f: f.end_date_ord or float("inf"))
+    elif sort_by == "End Date (latest first)":
+        fellows.sort(key=lambda f: f.end_date_ord, reverse=True)
+    elif sort_by == "Cohort (newest first)":
+        fellows.sort(key=lambda f: f.cohort or "", reverse=True)
+    elif sort_by == "Cohort (oldest first)":
+        fellows.sort(key=lambda f: f.cohort or "")
+    return fellows
+
+
+# ============ ALUMNI ============
+
+ALUMNI_SORT_OPTIONS = [
+    "Cohort (newest first)", "Cohort (oldest first)", "Name (A-Z)", "Name (Z-A)",
+    "Last Engaged (oldest first)", "Last Engaged (newest first)", "Organization (A-Z)", "Sector"
+]
+ALUMNI_DEFAULT_SORT = "Cohort (newest first)"
+
+ALUMNI_FACETS = {
+    "fellow_type": ("fellow_types", True),
+    "sector": ("sector", False),
+    "party": ("party", False),
+    "chamber": ("chamber", False),
+    "cohort": ("cohort", False)
+}
+
+
+def alumni_stats(alumni_list):
+    """Counts for the stat cards at the top of the Alumni page"""
+    return {
+        "total": len(alumni_list),
+        "govt": len([a for a in alumni_list if a.sector == "Government"]),
+        "private": len([a for a in alumni_list if a.sector == "Private"]),
+        "nonprofit_academia": len([a for a in alumni_list if a.sector in ["Nonprofit", "Academia"]]),
+        "policy": len([a for a in alumni_list if a.sector == "Policy/Think Tank"])
+    }
+
+
+def sort_alumni(alumni_list, sort_by):
+    """Sort a list of alumni in place by one of ALUMNI_SORT_OPTIONS"""
+    if sort_by == "Cohort (newest first)":
+        alumni_list.sort(key=lambda a: a.cohort or "", reverse=True)
+    elif sort_by == "Cohort (oldest first)":
+        alumni_list.sort(key=lambda a: a.cohort or "")
+    elif sort_by == "Name (A-Z)":
+        alumni_list.sort(key=lambda a: a.name.lower())
+    elif sort_by == "Name (Z-A)":
+        alumni_list.sort(key=lambda a: a.name.lower(), reverse=True)
+    elif sort_by == "Last Engaged (oldest first)":
+        alumni_list.sort(key=lambda a: a.last_engaged_ord)
+    elif sort_by == "Last Engaged (newest first)":
+        alumni_list.sort(key=lambda a: a.last_engaged_ord, reverse=True)
+    elif sort_by == "Organization (A-Z)":
+        alumni_list.sort(key=lambda a: (a.current_org or "").lower())
+    elif sort_by == "Sector":
+        alumni_list.sort(key=lambda a: a.sector or "")
+    return alumni_list
+
+
+# ============ ROSTER BACKENDS ============
+# A roster wraps one fetched list of records and answers the page's stats,
+# cohort, search, facet count and filter+sort queries. Pages build it with
+# helpers.cached_derived so it is constructed once per data version, not
+# once per rerun. Filters are FACETS names plus `search` (the search box)
+# and `ids` (a set of record IDs to keep); None means no filter.
+
+# Below this many rows NumPy's per-call overhead outweighs the vectorized
+# work and the plain list pipeline is faster (see benchmarks/bench.py).
+COLUMNAR_MIN_ROWS = 300
+
+class Roster:
+    """Records plus a FacetIndex over FACETS and search indexes over SEARCH_FIELDS"""
+
+    SEARCH_FIELDS = ()
+    FACETS = {}
+
+    def __init__(self, records):
+        self.records = list(records)
+        self.size = len(self.records)
+        self.row_of = {r.id: i for i, r in enumerate(self.records)}
+        self.facets = FacetIndex(self.records, self.FACETS)
+        self._index = None
+        self._fuzzy = None
+
+    @property
+    def index(self):
+        if self._index is None:
+            self._index = SearchIndex(self.records, self.SEARCH_FIELDS)
+        return self._index
+
+    @property
+    def fuzzy(self):
+        if self._fuzzy is None:
+            self._fuzzy = TrigramIndex(self.index)
+        return self._fuzzy
+
+    def search_rows(self, search):
+        """Row numbers matching a search box query, or None for no search"""
+        return self.index.search(search) if search else None
+
+    def base_bits(self, search=None, ids=None):
+        """Bitmap of rows passing the search box and `ids` filters, or None if neither is set"""
+        bits = None
+        rows = self.search_rows(search)
+        if rows is not None:
+            bits = rows_bitmap(rows)
+        if ids is not None:
+            id_bits = rows_bitmap(self.row_of[i] for i in ids if i in self.row_of)
+            bits = id_bits if bits is None else bits & id_bits
+        return bits
+
+    def matching(self, search=None, ids=None, **filters):
+        """Bitmap of rows passing every filter"""
+        return self.facets.select(filters, self.base_bits(search, ids))
+
+    def facet_counts(self, search=None, ids=None, **filters):
+        """Per-option counts for each filter selectbox under the other active filters"""
+        return self.facets.counts(filters, self.base_bits(search, ids))
+
+    def records_at(self, bits):
+        """Records for the rows set in a bitmap, in roster order"""
+        records = self.records
+        return [records[i] for i in bitmap_rows(bits)]
+
+    def fuzzy_matches(self, search, bits):
+        """Closest records to a misspelled query among the rows in `bits`, best first"""
+        keep = set(bitmap_rows(bits)).__contains__
+        return [self.records[i] for i in self.fuzzy.top(search, keep)]
+
+
+class FellowRoster(Roster):
+    """List-based Current Fellows pipeline (used when NumPy is unavailable)"""
+
+    SEARCH_FIELDS = FELLOW_SEARCH_FIELDS
+    FACETS = FELLOW_FACETS
+
+    def stats(self):
+        return fellow_stats(self.records)
+
+    def cohorts(self):
+        return cohort_options(self.records)
+
+    def query(self, sort_by=FELLOW_DEFAULT_SORT, search=None, ids=None, **filters):
+        """Filtered and sorted records"""
+        return sort_fellows(self.records_at(self.matching(search, ids, **filters)), sort_by)
+
+
+class AlumniRoster(Roster):
+    """List-based Alumni pipeline (used when NumPy is unavailable)"""
+
+    SEARCH_FIELDS = ALUMNI_SEARCH_FIELDS
+    FACETS = ALUMNI_FACETS
+
+    def stats(self):
+        return alumni_stats(self.records)
+
+    def cohorts(self):
+        return cohort_options(self.records)
+
+    def query(self, sort_by=ALUMNI_DEFAULT_SORT, search=None, ids=None, fuzzy=False, **filters):
+        """Filtered and sorted records.
+
+        With fuzzy, returns the closest matches to `search` by similarity instead.
+        """
+        if fuzzy and search:
+            return self.fuzzy_matches(search, self.matching(None, ids, **filters))
+        return sort_alumni(self.records_at(self.matching(search, ids, **filters)), sort_by)
+
+
+class Categorical:
+    """Integer codes for a column of repeated values"""
+
+    def __init__(self, values):
+        self.lookup = {}
+        self.codes = np.fromiter(
+            (self.lookup.setdefault(v, len(self.lookup)) for v in values), dtype=np.int32, count=len(values)
+        )
+
+    def mask(self, value):
+        code = self.lookup.get(value)
+        if code is None:
+            return np.zeros(len(self.codes), dtype=bool)
+        return self.codes == code
+
+    def isin(self, values):
+        return np.isin(self.codes, [self.lookup[v] for v in values if v in self.lookup])
+
+    def ranks(self):
+        """Each row's position in the sorted distinct values (a sort key)"""
+        position = {v: i for i, v in enumerate(sorted(self.lookup))}
+        remap = np.array([position[v] for v in self.lookup], dtype=np.int32)
+        return remap[self.codes] if len(remap) else self.codes
+
+
+class ColumnarRoster(Roster):
+    """Shared NumPy machinery: cached stable argsorts for sorts.
+
+    Subclasses fill in columns and SORT_KEYS. A filtered, sorted result is
+    order[mask[order]], with the mask unpacked from the filter bitmap: one
+    pass over a precomputed permutation, so only the first query per sort
+    option pays for the sort.
+    """
+
+    SORT_KEYS = {}
+
+    def __init__(self, records):
+        super().__init__(records)
+        self._orders = {}
+
+    def order(self, sort_by, today_ord=None):
+        key = (sort_by, today_ord)
+        if key not in self._orders:
+            build = self.SORT_KEYS.get(sort_by)
+            if build is None:
+                self._orders[key] = np.arange(self.size)
+            else:
+                self._orders[key] = build(self, today_ord)
+        return self._orders[key]
+
+    def select(self, bits, sort_by, today_ord=None):
+        mask = bitmap_mask(bits, self.size)
+        order = self.order(sort_by, today_ord)
+        return [self.records[i] for i in order[mask[order]]]
+
+    def cohorts(self):
+        return sorted((c for c in self.cohort.lookup if c), reverse=True)
+
+
+def bitmap_mask(bits, size):
+    """Boolean row mask for a facet bitmap"""
+    data = np.frombuffer(bits.to_bytes((size + 7) // 8, "little"), dtype=np.uint8)
+    return np.unpackbits(data, count=size, bitorder="little").view(bool)
+
+
+def stable_order(key):
+    return np.argsort(key, kind="stable")
+
+
+def days_since_column(ordinals, today_ord):
+    return np.where(ordinals > 0, today_ord - ordinals, 999)
+
+
+class FellowColumns(ColumnarRoster):
+    """Current Fellows roster as NumPy columns"""
+
+    SEARCH_FIELDS = FELLOW_SEARCH_FIELDS
+    FACETS = FELLOW_FACETS
+
+    SORT_KEYS = {
+        "Priority (Flagged first)": lambda self, today_ord: np.lexsort((
+            -days_since_column(self.last_check_in, today_ord), self.priority
+        )),
+        "Name (A-Z)": lambda self, _: stable_order(self.name.ranks()),
+        "Name (Z-A)": lambda self, _: stable_order(-self.name.ranks()),
+        "Last Check-in (oldest first)": lambda self, _: stable_order(self.last_check_in),
+        "Last Check-in (newest first)": lambda self, _: stable_order(-self.last_check_in),
+        "End Date (soonest first)": lambda self, _: stable_order(
+            np.where(self.end_date > 0, self.end_date, np.iinfo(np.int64).max)
+        ),
+        "End Date (latest first)": lambda self, _: stable_order(-self.end_date),
+        "Cohort (newest first)": lambda self, _: stable_order(-self.cohort.ranks()),
+        "Cohort (oldest first)": lambda self, _: stable_order(self.cohort.ranks())
+    }
+
+    def __init__(self, fellows):
+        super().__init__(fellows)
+        records = self.records
+        self.name = Categorical([f.name.lower() for f in records])
+        self.status = Categorical([f.status for f in records])
+        self.cohort = Categorical([f.cohort or "" for f in records])
+        self.last_check_in = np.array([f.last_check_in_ord for f in records], dtype=np.int64)
+        self.end_date = np.array([f.end_date_ord for f in records], dtype=np.int64)
+        self.is_aisf = np.array([bool(f.fellow_type) and "AI Security" in f.fellow_type for f in records], dtype=bool)
+        self.priority = np.array([STATUS_PRIORITY.get(f.status, 3) for f in records], dtype=np.int8)
+
+    def stats(self):
+        today_ord = date.today().toordinal()
+        active = self.status.isin(["on-track", "Active"])
+        needs_checkin = active & (days_since_column(self.last_check_in, today_ord) > NEEDS_CHECKIN_DAYS) & ~self.is_aisf
+        return {
+            "total": self.size,
+            "on_track": int(active.sum()),
+            "flagged": int(self.status.isin(["flagged", "Flagged"]).sum()),
+            "ending_soon": int(self.status.isin(["ending-soon", "Ending Soon"]).sum()),
+            "needs_checkin": int(needs_checkin.sum())
+        }
+
+    def query(self, sort_by=FELLOW_DEFAULT_SORT, search=None, ids=None, **filters):
+        today_ord = date.today().toordinal() if sort_by == "Priority (Flagged first)" else None
+        return self.select(self.matching(search, ids, **filters), sort_by, today_ord)
+
+
+class AlumniColumns(ColumnarRoster):
+    """Alumni roster as NumPy columns"""
+
+    SEARCH_FIELDS = ALUMNI_SEARCH_FIELDS
+    FACETS = ALUMNI_FACETS
+
+    SORT_KEYS = {
+        "Cohort (newest first)": lambda self, _: stable_order(-self.cohort.ranks()),
+        "Cohort (oldest first)": lambda self, _: stable_order(self.cohort.ranks()),
+        "Name (A-Z)": lambda self, _: stable_order(self.name.ranks()),
+        "Name (Z-A)": lambda self, _: stable_order(-self.name.ranks()),
+        "Last Engaged (oldest first)": lambda self, _: stable_order(self.last_engaged),
+        "Last Engaged (newest first)": lambda self, _: stable_order(-self.last_engaged),
+        "Organization (A-Z)": lambda self, _: stable_order(self.current_org.ranks()),
+        "Sector": lambda self, _: stable_order(self.sector.ranks())
+    }
+
+    def __init__(self, alumni_list):
+        super().__init__(alumni_list)
+        records = self.records
+        self.name = Categorical([a.name.lower() for a in records])
+        self.cohort = Categorical([a.cohort or "" for a in records])
+        self.sector = Categorical([a.sector or "" for a in records])
+        self.current_org = Categorical([(a.current_org or "").lower() for a in records])
+        self.last_engaged = np.array([a.last_engaged_ord for a in records], dtype=np.int64)
+
+    def stats(self):
+        return {
+            "total": self.size,
+            "govt": int(self.sector.mask("Government").sum()),
+            "private": int(self.sector.mask("Private").sum()),
+            "nonprofit_academia": int(self.sector.isin(["Nonprofit", "Academia"]).sum()),
+            "policy": int(self.sector.mask("Policy/Think Tank").sum())
+        }
+
+    def query(self, sort_by=ALUMNI_DEFAULT_SORT, search=None, ids=None, fuzzy=False, **filters):
+        if fuzzy and search:
+            return self.fuzzy_matches(search, self.matching(None, ids, **filters))
+        return self.select(self.matching(search, ids, **filters), sort_by)
+
+
+def use_columns(records):
+    return np is not None and len(records) >= COLUMNAR_MIN_ROWS
+
+
+def fellow_roster(fellows):
+    """Best backend for a fetched list of fellows"""
+    return FellowColumns(fellows) if use_columns(fellows) else FellowRoster(fellows)
+
+
+def alumni_roster(alumni_list):
+    """Best backend for a fetched list of alumni"""
+    return AlumniColumns(alumni_list) if use_columns(alumni_list) else AlumniRoster(alumni_list)
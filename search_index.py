@@ -0,0 +1,156 @@
+import heapq
+import re
+from bisect import bisect_left
+
+# ============ SEARCH INDEX ============
+# Search box queries are split into terms; a record matches when every term
+# is a prefix of some word in its searchable fields ("sen cant" finds
+# "Sen. Maria Cantwell"). Words map to the set of row numbers containing
+# them, and the sorted vocabulary turns a prefix into one contiguous slice.
+
+FELLOW_SEARCH_FIELDS = ("name", "office", "prior_role", "education")
+ALUMNI_SEARCH_FIELDS = (
+    "name", "office_served", "current_role", "current_org", "location", "prior_role", "education"
+)
+
+WORD = re.compile(r"\w+")
+TERM_CACHE_SIZE = 256
+
+FUZZY_MIN_SIMILARITY = 0.3  # trigram overlap a word needs to count as a match for a term
+FUZZY_TOP_K = 50
+
+
+def tokenize(text):
+    """Lowercased words in a field value or query"""
+    return WORD.findall(text.casefold()) if text else []
+
+
+class SearchIndex:
+    """Inverted index from words to the rows of `records` that contain them.
+
+    Built once per fetched list (the rosters hold one for as long as their
+    data version lives); a query then costs a few dict lookups and set
+    intersections instead of a scan over every record.
+    """
+
+    def __init__(self, records, fields):
+        postings = {}
+        for row, record in enumerate(records):
+            for field in fields:
+                for word in tokenize(getattr(record, field, "")):
+                    postings.setdefault(word, set()).add(row)
+        self.size = len(records)
+        self.postings = postings
+        self.vocabulary = sorted(postings)
+        self._terms = {}
+
+    def term_rows(self, term):
+        """Rows with a word starting with `term` (memoized, since each keystroke repeats most terms)"""
+        rows = self._terms.get(term)
+        if rows is None:
+            vocabulary = self.vocabulary
+            start = bisect_left(vocabulary, term)
+            end = bisect_left(vocabulary, term + "\U0010ffff", start)
+            if end - start == 1:
+                rows = frozenset(self.postings[vocabulary[start]])
+            else:
+                rows = frozenset().union(*(self.postings[word] for word in vocabulary[start:end]))
+            if len(self._terms) >= TERM_CACHE_SIZE:
+                self._terms.clear()
+            self._terms[term] = rows
+        return rows
+
+    def search(self, query):
+        """Rows matching every term of `query`, or None when it has no terms (no filter)"""
+        terms = tokenize(query)
+        if not terms:
+            return None
+        # Intersect smallest first so later terms only shrink a small set
+        matches = sorted((self.term_rows(term) for term in set(terms)), key=len)
+        rows = set(matches[0])
+        for other in matches[1:]:
+            if not rows:
+                break
+            rows &= other
+        return rows
+
+
+# ============ FUZZY SEARCH ============
+# Typo tolerance works on the SearchIndex vocabulary rather than the records:
+# each distinct word is split into character trigrams, a query term is
+# compared only with words sharing one of its trigrams, and the rows of the
+# similar words are scored. Records with no trigram in common with the query
+# are never looked at.
+
+def trigrams(word):
+    """Character trigrams of a word, padded at the front so short words and
+    prefixes still have some ("cant" -> "  c", " ca", "can", "ant")"""
+    padded = "  " + word
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """Trigram index over a SearchIndex's vocabulary, for ranked fuzzy lookups"""
+
+    def __init__(self, index):
+        self.index = index
+        self.words = index.vocabulary
+        self.gram_counts = []
+        grams = {}
+        for word_id, word in enumerate(self.words):
+            word_grams = trigrams(word)
+            self.gram_counts.append(len(word_grams))
+            for gram in word_grams:
+                grams.setdefault(gram, []).append(word_id)
+        self.grams = grams
+        self._terms = {}
+
+    def similar_words(self, term):
+        """{word ID: similarity} for vocabulary words close to `term` (memoized)"""
+        similar = self._terms.get(term)
+        if similar is None:
+            term_grams = trigrams(term)
+            shared = {}
+            for gram in term_grams:
+                for word_id in self.grams.get(gram, ()):
+                    shared[word_id] = shared.get(word_id, 0) + 1
+            similar = {}
+            for word_id, count in shared.items():
+                # Jaccard similarity of the two trigram sets
+                score = count / (len(term_grams) + self.gram_counts[word_id] - count)
+                if score >= FUZZY_MIN_SIMILARITY:
+                    similar[word_id] = score
+            if len(self._terms) >= TERM_CACHE_SIZE:
+                self._terms.clear()
+            self._terms[term] = similar
+        return similar
+
+    def scores(self, query):
+        """{row: score} for rows fuzzily matching every term of `query`.
+
+        A row's score is the mean over terms of its best word similarity.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return {}
+        postings = self.index.postings
+        totals = None
+        for term in terms:
+            best = {}
+            for word_id, score in self.similar_words(term).items():
+                for row in postings[self.words[word_id]]:
+                    if score > best.get(row, 0):
+                        best[row] = score
+            if totals is None:
+                totals = best
+            else:
+                totals = {row: total + best[row] for row, total in totals.items() if row in best}
+            if not totals:
+                return {}
+        return {row: total / len(terms) for row, total in totals.items()}
+
+    def top(self, query, keep=None, k=FUZZY_TOP_K):
+        """Up to k best-scoring rows for `query`, best first, among rows where keep(row) is true"""
+        scores = self.scores(query)
+        rows = scores if keep is None else [row for row in scores if keep(row)]
+        return heapq.nsmallest(k, rows, key=lambda row: (-scores[row], row))
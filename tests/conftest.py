@@ -0,0 +1,6 @@
+from pathlib import Path
+
+from streamlit import config
+
+# helpers.py reads st.secrets at import time; point it at the test placeholders
+config.set_option("secrets.files", [str(Path(__file__).with_name("secrets.toml"))])
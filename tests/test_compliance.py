@@ -0,0 +1,79 @@
+from datetime import date
+
+import pytest
+
+from compliance import roster_compliance
+from helpers import calculate_report_streak, get_required_report_months
+from records import Fellow, StatusReport
+
+SENIOR = "Senior Congressional Innovation Fellow"
+CIF = "Congressional Innovation Fellow"
+
+# (id, requires reports, report start, end override, fellow type)
+FELLOWS = [
+    ("recA", True, "2025-01-15", "", CIF),
+    ("recB", True, "2025-06-01", "", SENIOR),
+    ("recC", True, "2025-10-01", "Mar 2026", CIF),
+    ("recD", True, "2026-02-01", "", CIF),
+    ("recE", True, "2026-09-01", "", CIF),
+    ("recF", False, "2025-01-15", "", CIF),
+    ("recG", True, "", "", CIF),
+    ("recH", True, "2025-03-01", "", "AI Security Fellow"),
+    ("recI", True, "2026-10-01", "", CIF),  # starts after the default end: no months
+]
+
+# (fellow id, month, submitted)
+REPORTS = [
+    ("recA", "Oct 2025", True), ("recA", "Nov 2025", True), ("recA", "Dec 2025", True),
+    ("recA", "Jan 2026", True), ("recA", "Feb 2026", True),
+    ("recB", "Nov 2025", True), ("recB", "Dec 2025", False), ("recB", "Jan 2026", True),
+    ("recC", "Oct 2025", True), ("recC", "Nov 2025", True),
+    ("recC", "Apr 2026", True),  # outside the window
+    ("recD", "Feb 2026", True),
+    ("recH", "Jun 2025", True), ("recH", "Jan 2026", False),
+    ("recF", "Jan 2026", True),
+    ("recA", "Not a month", True),
+]
+
+
+def fellows():
+    return [
+        Fellow.from_record({"id": fellow_id, "fields": {
+            "Name": fellow_id,
+            "Requires Monthly Reports": requires,
+            "Report Start Date": start,
+            "Report End Month": end,
+            "Fellow Type": fellow_type
+        }})
+        for fellow_id, requires, start, end, fellow_type in FELLOWS
+    ]
+
+
+def reports():
+    return [
+        StatusReport.from_record({"id": f"rec{i}", "fields": {
+            "Fellow": [fellow_id], "Month": month, "Submitted": submitted
+        }})
+        for i, (fellow_id, month, submitted) in enumerate(REPORTS)
+    ]
+
+
+@pytest.mark.parametrize("today", [
+    date(2026, 2, 27),  # Feb not yet due
+    date(2026, 2, 28),  # Feb due today, counts as passed
+    date(2026, 3, 15),
+    date(2026, 12, 1),  # after every default window
+    date(2025, 1, 1),   # before every window
+])
+def test_roster_compliance_matches_calculate_report_streak(today):
+    roster, all_reports = fellows(), reports()
+    compliance = roster_compliance(roster, all_reports, today)
+
+    expected = {}
+    for fellow in roster:
+        required = get_required_report_months(fellow)
+        if required:
+            own = [r for r in all_reports if fellow.id in r.fellow]
+            expected[fellow.id] = calculate_report_streak(own, required, today)
+
+    assert compliance == expected
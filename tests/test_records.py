@@ -0,0 +1,20 @@
+from records import Fellow
+
+
+def fellow(**fields):
+    return Fellow.from_record({"id": "rec1", "fields": {"Name": "Ada Lovelace", **fields}})
+
+
+def test_content_hash_is_stable_for_equal_records():
+    assert fellow(Office="Sen. Smith").content_hash() == fellow(Office="Sen. Smith").content_hash()
+
+
+def test_content_hash_changes_with_field_values():
+    assert fellow(Office="Sen. Smith").content_hash() != fellow(Office="Rep. Jones").content_hash()
+
+
+def test_content_hash_accepts_list_valued_text_field():
+    # Lookup and attachment fields come back from Airtable as lists or dicts
+    record = fellow(Office=["Sen. Smith", "Rep. Jones"], Notes={"state": "generated"})
+    assert record.content_hash() == fellow(Office=["Sen. Smith", "Rep. Jones"], Notes={"state": "generated"}).content_hash()
+    assert record.content_hash() != fellow(Office=["Sen. Smith"], Notes={"state": "generated"}).content_hash()
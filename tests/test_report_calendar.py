@@ -0,0 +1,31 @@
+from report_calendar import month_label, report_window, required_month_labels
+
+
+def labels(window):
+    return list(required_month_labels(*window))
+
+
+def test_default_window_runs_through_sep_2026():
+    months = labels(report_window(True, "2025-01-15"))
+    assert months[0] == "Jan 2025"
+    assert months[-1] == "Sep 2026"
+    assert len(months) == 21
+
+
+def test_senior_default_window_runs_through_nov_2026():
+    start, end = report_window(True, "2025-01-15", fellow_type="Senior Congressional Innovation Fellow")
+    assert month_label(end) == "Nov 2026"
+
+
+def test_end_month_override():
+    assert labels(report_window(True, "2026-02-01", "Apr 2026")) == ["Feb 2026", "Mar 2026", "Apr 2026"]
+
+
+def test_start_after_default_end_has_no_months():
+    assert labels(report_window(True, "2026-10-01")) == []
+
+
+def test_no_window_without_reports_or_start_date():
+    assert report_window(False, "2025-01-15") is None
+    assert report_window(True, "") is None
+    assert report_window(True, "2025-01-15", "Someday") is None
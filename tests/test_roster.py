@@ -0,0 +1,78 @@
+import random
+from datetime import date
+
+import pytest
+
+from benchmarks.synthetic import generate_alumni, generate_fellows
+from records import Alumni, Fellow, enrich
+from roster import (
+    ALUMNI_SORT_OPTIONS, FELLOW_SORT_OPTIONS,
+    AlumniColumns, AlumniRoster, FellowColumns, FellowRoster
+)
+
+pytest.importorskip("numpy")
+
+ROWS = 400
+
+FELLOW_QUERIES = [
+    ("", {}),
+    ("", {"status": "Active"}),
+    ("", {"party": "Democrat", "chamber": "Senate"}),
+    ("", {"fellow_type": "Congressional Innovation Fellow", "status": "Flagged"}),
+    ("a", {}),
+    ("sen", {"chamber": "Senate"}),
+    ("zzzz", {}),
+]
+
+ALUMNI_QUERIES = [
+    ("", {}),
+    ("", {"sector": "Private"}),
+    ("", {"fellow_type": "Senior Congressional Innovation Fellow", "party": "Republican"}),
+    ("a", {"chamber": "House"}),
+    ("policy", {}),
+    ("zzzz", {"sector": "Government"}),
+]
+
+
+@pytest.fixture(scope="module")
+def fellows():
+    records = generate_fellows(random.Random(1), ROWS, date.today())
+    return enrich([Fellow.from_record(r) for r in records])
+
+
+@pytest.fixture(scope="module")
+def alumni():
+    records = generate_alumni(random.Random(2), ROWS, date.today())
+    return enrich([Alumni.from_record(r) for r in records])
+
+
+def ids(records):
+    return [r.id for r in records]
+
+
+@pytest.mark.parametrize("sort_by", FELLOW_SORT_OPTIONS)
+@pytest.mark.parametrize("search,filters", FELLOW_QUERIES)
+def test_fellow_backends_agree(fellows, sort_by, search, filters):
+    rows, columns = FellowRoster(fellows), FellowColumns(fellows)
+    assert ids(columns.query(sort_by, search=search, **filters)) == ids(rows.query(sort_by, search=search, **filters))
+    assert columns.facet_counts(search=search, **filters) == rows.facet_counts(search=search, **filters)
+
+
+@pytest.mark.parametrize("sort_by", ALUMNI_SORT_OPTIONS)
+@pytest.mark.parametrize("search,filters", ALUMNI_QUERIES)
+def test_alumni_backends_agree(alumni, sort_by, search, filters):
+    rows, columns = AlumniRoster(alumni), AlumniColumns(alumni)
+    assert ids(columns.query(sort_by, search=search, **filters)) == ids(rows.query(sort_by, search=search, **filters))
+    assert columns.facet_counts(search=search, **filters) == rows.facet_counts(search=search, **filters)
+
+
+def test_fuzzy_alumni_backends_agree(alumni):
+    rows, columns = AlumniRoster(alumni), AlumniColumns(alumni)
+    for search in ("polcy advisor", "stanfrod", "goggle"):
+        assert ids(columns.query(search=search, fuzzy=True)) == ids(rows.query(search=search, fuzzy=True))
+
+
+def test_stats_agree(fellows, alumni):
+    assert FellowColumns(fellows).stats() == FellowRoster(fellows).stats()
+    assert AlumniColumns(alumni).stats() == AlumniRoster(alumni).stats()
+    assert FellowColumns(fellows).cohorts() == FellowRoster(fellows).cohorts()